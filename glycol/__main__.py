@@ -1,3 +1,9 @@
 from glycol.main import main
 
-main()
+# Guarded so multiprocessing's spawn start method (Windows/macOS) can
+# re-import this module in pool workers without re-running the app:
+# load_aircraft_data parses the big dump in a ProcessPoolExecutor, and
+# an unguarded main() would recurse into argument parsing, logging
+# setup, and another pool per worker.
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,71 @@
+import concurrent.futures
 import gzip
+import io
 import json
+import mmap
+import os
+import pickle
+import sys
+import zlib
 from pathlib import Path
 from urllib.request import Request, urlopen
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - pysimdjson is optional
+    simdjson = None
+
+try:
+    import rapidgzip
+except ImportError:  # pragma: no cover - rapidgzip is optional
+    rapidgzip = None
+
+
+def _read_db_bytes(path: Path) -> bytes:
+    """Decompress the whole dump into one bytes buffer.
+
+    mmap + one-shot zlib decompression lets the kernel page the
+    compressed file straight into the decompressor with no read-loop or
+    chunk copies. rapidgzip (parallel) still wins when installed, and
+    any exotic stream (e.g. multi-member gzip) falls back to a plain
+    read.
+    """
+    if rapidgzip is None:
+        try:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                do = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+                data = do.decompress(mm)
+                if do.eof and not do.unused_data:
+                    return data
+                # Bytes past the first stream mean a multi-member
+                # archive; only the first member was decoded, so fall
+                # through to GzipFile, which walks every member
+        except (OSError, zlib.error):
+            pass
+    with _open_db(path) as f:
+        return f.read()
+
+
+def _open_db(path: Path) -> io.BufferedIOBase:
+    """Open the gzipped dump for binary line iteration.
+
+    rapidgzip decompresses across all cores when installed; otherwise a
+    128 KiB BufferedReader over GzipFile amortizes decompression into
+    large chunks instead of letting line iteration nibble at the stream.
+    """
+    if rapidgzip is not None:
+        return rapidgzip.open(path, parallelization=0)  # 0 = all cores
+    return io.BufferedReader(gzip.open(path, "rb"), buffer_size=128 * 1024)
+
 # ADS-B Exchange Aircraft Database
 _DATA_FILE = Path(__file__).resolve().parent / "data" / "basic-ac-db.json.gz"
 _URL = "https://downloads.adsbexchange.com/downloads/basic-ac-db.json.gz"
@@ -31,44 +94,139 @@ def _ensure_data_file(path: Path, url: str) -> None:
     tmp.replace(path)
 
 
-def load_aircraft_data(path: Path) -> tuple[dict[str, str], dict[str, str]]:
-    """Load aircraft database from gzipped NDJSON.
-
-    Returns:
-        (REG → ICAO24 mapping, ICAO24 → type code mapping)
-    """
+def _parse_lines(lines) -> tuple[dict[str, str], dict[str, str]]:
+    """Parse an iterable of NDJSON byte lines into the two aircraft maps."""
     reg_to_icao: dict[str, str] = {}
     icao_to_type: dict[str, str] = {}
 
-    with gzip.open(path, "rt", encoding="utf-8") as f:
-        for line in f:
-            row = json.loads(line)
+    # Reuse a single simdjson parser across all lines so its internal buffers
+    # are recycled; only the three fields we read are ever materialized.
+    parser = simdjson.Parser() if simdjson is not None else None
 
-            reg = row.get("reg")
-            icao = row.get("icao")
-            type_code = row.get("icaotype")
+    for line in lines:
+        if not line.strip():
+            continue
+        row = parser.parse(line) if parser is not None else _loads(line)
 
-            if isinstance(icao, str):
-                icao_lower = icao.lower()
+        reg = row.get("reg")
+        icao = row.get("icao")
+        type_code = row.get("icaotype")
 
-                # Build REG → ICAO24 mapping
-                if isinstance(reg, str):
-                    reg_to_icao[reg.upper()] = icao_lower
+        if isinstance(icao, str):
+            icao_lower = icao.lower()
 
-                # Build ICAO24 → type code mapping
-                if isinstance(type_code, str) and type_code:
-                    icao_to_type[icao_lower] = type_code.upper()
+            # Build REG → ICAO24 mapping
+            if isinstance(reg, str):
+                reg_to_icao[reg.upper()] = icao_lower
+
+            # Build ICAO24 → type code mapping. Type codes repeat across
+            # thousands of airframes (every "B738", "C172", ...), so
+            # interning collapses them to one shared object and makes
+            # later equality checks pointer comparisons.
+            if isinstance(type_code, str) and type_code:
+                icao_to_type[icao_lower] = sys.intern(type_code.upper())
 
     return reg_to_icao, icao_to_type
 
 
-# public, module-level constants
-_ensure_data_file(_DATA_FILE, _URL)
+def _parse_chunk(buf: bytes) -> tuple[dict[str, str], dict[str, str]]:
+    """Process-pool worker: parse one slice of the decompressed dump."""
+    # BytesIO yields lines lazily; splitlines() would materialize a list of
+    # every line object in the chunk up front.
+    return _parse_lines(io.BytesIO(buf))
 
-REG_TO_ICAO24: dict[str, str]
-ICAO24_TO_TYPE: dict[str, str]
 
-REG_TO_ICAO24, ICAO24_TO_TYPE = load_aircraft_data(_DATA_FILE)
+# Only fan out to a process pool when the compressed dump is big enough for
+# the parse work to dwarf the cost of shipping chunks to the workers.
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+def load_aircraft_data(path: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Load aircraft database from gzipped NDJSON.
+
+    Returns:
+        (REG → ICAO24 mapping, ICAO24 → type code mapping)
+    """
+    workers = os.cpu_count() or 1
+    if workers > 1 and path.stat().st_size >= _PARALLEL_MIN_BYTES:
+        # Gzip streams are not seekable by byte range, so decompress once in
+        # this process, then split at line boundaries and parse in parallel.
+        data = _read_db_bytes(path)
+
+        chunks: list[bytes] = []
+        start = 0
+        step = len(data) // workers
+        for i in range(1, workers):
+            end = data.find(b"\n", max(start, step * i))
+            if end == -1:
+                break
+            end += 1
+            chunks.append(data[start:end])
+            start = end
+        chunks.append(data[start:])
+
+        reg_to_icao: dict[str, str] = {}
+        icao_to_type: dict[str, str] = {}
+        with concurrent.futures.ProcessPoolExecutor(len(chunks)) as pool:
+            for part_reg, part_type in pool.map(_parse_chunk, chunks):
+                reg_to_icao.update(part_reg)
+                icao_to_type.update(part_type)
+        return reg_to_icao, icao_to_type
+
+    # Binary mode: both parsers accept bytes directly, skipping a utf-8 decode pass
+    with _open_db(path) as f:
+        return _parse_lines(f)
+
+
+def _load_cached(path: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Load the aircraft maps via a pickle cache next to the gzip file.
+
+    Parsing the NDJSON dump takes seconds; unpickling the two finished
+    dicts is near-instant. The cache is keyed on the source file's
+    (mtime, size) and rebuilt automatically when the dump changes.
+    """
+    cache = path.with_suffix(".pkl")
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    try:
+        # One read + pickle.loads over bytes beats pickle.load pulling the
+        # file through buffered I/O in small framed reads
+        cached_key, reg_to_icao, icao_to_type = pickle.loads(cache.read_bytes())
+        if cached_key == key:
+            return reg_to_icao, icao_to_type
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass
+
+    reg_to_icao, icao_to_type = load_aircraft_data(path)
+
+    tmp = cache.with_suffix(cache.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((key, reg_to_icao, icao_to_type), f, pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache)
+    except OSError:
+        # Cache is purely an optimization; run without it if the dir is read-only
+        tmp.unlink(missing_ok=True)
+
+    return reg_to_icao, icao_to_type
+
 
-# Legacy alias for backwards compatibility
-AIRCRAFT: dict[str, str] = REG_TO_ICAO24
+# Public, module-level constants, loaded lazily on first attribute access
+# (PEP 562) so importing glycol.aircraft stays cheap for code paths that
+# never touch the DB (CLI tools, tests). AIRCRAFT is a legacy alias for
+# REG_TO_ICAO24 kept for backwards compatibility.
+REG_TO_ICAO24: dict[str, str]
+ICAO24_TO_TYPE: dict[str, str]
+AIRCRAFT: dict[str, str]
+
+
+def __getattr__(name: str) -> dict[str, str]:
+    if name in ("REG_TO_ICAO24", "ICAO24_TO_TYPE", "AIRCRAFT"):
+        _ensure_data_file(_DATA_FILE, _URL)
+        reg_to_icao, icao_to_type = _load_cached(_DATA_FILE)
+        g = globals()
+        g["REG_TO_ICAO24"] = g["AIRCRAFT"] = reg_to_icao
+        g["ICAO24_TO_TYPE"] = icao_to_type
+        return g[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,46 @@
+import functools
 import json
 import math
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
 # ICAO code -> (latitude, longitude, name)
 _DATA_FILE = Path(__file__).resolve().parent / "data" / "us_airports.json"
 
 
 def _load_airports() -> dict[str, tuple[float, float, str]]:
-    with open(_DATA_FILE) as f:
-        raw = json.load(f)
-    return {code: (v[0], v[1], v[2]) for code, v in raw.items()}
+    raw = _loads(_DATA_FILE.read_bytes())
+    # tuple(v) converts each [lat, lon, name] row in one C call instead of
+    # three per-element index lookups. Keys are normalized to uppercase once
+    # here and interned so lookups of already-uppercase codes hit the
+    # identity fast path; ICAO idents arrive uppercase already, so the
+    # re-cased copy is only paid on the exceptions.
+    return {
+        sys.intern(code if code.isupper() else code.upper()): tuple(v)
+        for code, v in raw.items()
+    }
 
 
 AIRPORTS: dict[str, tuple[float, float, str]] = _load_airports()
 
+# 1/cos(lat) per airport, precomputed once so the per-poll bbox calculation
+# is pure multiplication with no trig in the hot path.
+_INV_COS_LAT: dict[str, float] = {
+    code: 1.0 / math.cos(math.radians(v[0])) for code, v in AIRPORTS.items()
+}
+
 
 NM_TO_DEG_LAT = 1.0 / 60.0  # 1 nautical mile ≈ 1/60 degree latitude
 
 
+@functools.lru_cache(maxsize=256)
 def get_bounding_box(
     icao_code: str,
     radius_nm: float = 5.0,
@@ -29,20 +52,38 @@ def get_bounding_box(
     If the ICAO code is in the known dict, its coordinates are used.
     Otherwise, *lat* and *lon* must be supplied.
     Returns None when coordinates cannot be determined.
+
+    Memoized: the poll loop recomputes the box for the same airport and
+    radius on every iteration, and AIRPORTS is immutable at runtime, so
+    the steady-state call is a cache hit with no arithmetic at all.
     """
-    if icao_code.upper() in AIRPORTS:
-        lat, lon, _ = AIRPORTS[icao_code.upper()]
-    if lat is None or lon is None:
+    # Callers normalize to uppercase already; only re-case on a miss.
+    code = icao_code
+    entry = AIRPORTS.get(code)
+    if entry is None:
+        code = icao_code.upper()
+        entry = AIRPORTS.get(code)
+    if entry is not None:
+        lat, lon, _ = entry
+        inv_cos = _INV_COS_LAT[code]
+    elif lat is None or lon is None:
         return None
+    else:
+        inv_cos = 1.0 / math.cos(math.radians(lat))
 
     dlat = radius_nm * NM_TO_DEG_LAT
     # Longitude degrees per NM varies with latitude
-    dlon = radius_nm * NM_TO_DEG_LAT / math.cos(math.radians(lat))
+    dlon = radius_nm * NM_TO_DEG_LAT * inv_cos
 
     return (lat - dlat, lat + dlat, lon - dlon, lon + dlon)
 
 
+@functools.lru_cache(maxsize=256)
 def airport_name(icao_code: str) -> str:
-    """Return the human-readable name, or the code itself if unknown."""
-    entry = AIRPORTS.get(icao_code.upper())
+    """Return the human-readable name, or the code itself if unknown.
+
+    Memoized: AIRPORTS is immutable at runtime and callers resolve the
+    same handful of codes over and over (status lines, /api/start).
+    """
+    entry = AIRPORTS.get(icao_code) or AIRPORTS.get(icao_code.upper())
     return entry[2] if entry else icao_code.upper()
@@ -1,12 +1,20 @@
+import json
 import time
 import requests
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
 from glycol.auth import OpenSkyAuth
 
 STATES_URL = "https://opensky-network.org/api/states/all"
 
 # Field indices in the OpenSky state vector array
-_STATE_FIELDS = [
+_STATE_FIELDS = (
     "icao24",  # 0
     "callsign",  # 1
     "origin_country",  # 2
@@ -25,17 +33,24 @@ _STATE_FIELDS = [
     "spi",  # 15
     "position_source",  # 16
     "category",  # 17  (extended mode only)
-]
+)
+
+
+_N_FIELDS = len(_STATE_FIELDS)
 
 
 def _parse_state(raw: list) -> dict:
     """Convert an index-based state vector into a named dict."""
-    d = {}
-    for i, name in enumerate(_STATE_FIELDS):
-        d[name] = raw[i] if i < len(raw) else None
+    # dict(zip(...)) builds the row in one C call; zip stops at the shorter
+    # input, so pad short vectors (no category field) rather than branching
+    # per element.
+    if len(raw) < _N_FIELDS:
+        raw = raw + [None] * (_N_FIELDS - len(raw))
+    d = dict(zip(_STATE_FIELDS, raw))
     # Normalize callsign whitespace
-    if d.get("callsign"):
-        d["callsign"] = d["callsign"].strip()
+    cs = d["callsign"]
+    if cs:
+        d["callsign"] = cs.strip()
     return d
 
 
@@ -46,6 +61,9 @@ class OpenSkyClient:
         self.auth = auth
         self.rate_limit_remaining: int | None = None
         self._backoff_until: float = 0.0
+        # One session for all polls: reuses the TLS connection instead of
+        # paying a TCP + TLS handshake per request
+        self._session = requests.Session()
 
     def get_states(
         self,
@@ -78,7 +96,9 @@ class OpenSkyClient:
         headers = self.auth.get_headers()
 
         try:
-            resp = requests.get(STATES_URL, params=params, headers=headers, timeout=15)
+            resp = self._session.get(
+                STATES_URL, params=params, headers=headers, timeout=15
+            )
 
             # Track rate limits
             rl = resp.headers.get("X-Rate-Limit-Remaining")
@@ -94,15 +114,18 @@ class OpenSkyClient:
                 # Token may have expired; force re-auth and retry once
                 self.auth.authenticate()
                 headers = self.auth.get_headers()
-                resp = requests.get(
+                resp = self._session.get(
                     STATES_URL, params=params, headers=headers, timeout=15
                 )
 
             resp.raise_for_status()
-            data = resp.json()
+            # Parse the raw bytes directly; orjson skips requests' charset
+            # detection and an intermediate str
+            data = _loads(resp.content)
 
             states_raw = data.get("states") or []
-            return [_parse_state(s) for s in states_raw]
+            # map() drives the conversion loop in C with no per-row bytecode
+            return list(map(_parse_state, states_raw))
 
         except requests.RequestException:
             return []
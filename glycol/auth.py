@@ -8,6 +8,9 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# Default data directory, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
 TOKEN_URL = (
     "https://auth.opensky-network.org/auth/realms/opensky-network"
     "/protocol/openid-connect/token"
@@ -22,11 +25,13 @@ class OpenSkyAuth:
         self.client_secret = client_secret
         self._token: str | None = None
         self._expires_at: float = 0.0
+        # Reused across token refreshes to keep the TLS connection warm
+        self._session = requests.Session()
 
     def authenticate(self) -> bool:
         """Request a new bearer token. Returns True on success."""
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 TOKEN_URL,
                 data={
                     "grant_type": "client_credentials",
@@ -84,7 +89,7 @@ def load_credentials_from_file(
     if credentials_path is None:
         if data_dir is None:
             # Default to glycol/data/credentials.json
-            data_dir = Path(__file__).parent / "data"
+            data_dir = _DATA_DIR
         credentials_path = Path(data_dir) / "credentials.json"
     else:
         credentials_path = Path(credentials_path)
@@ -1,8 +1,7 @@
+import csv
 import datetime
 import os
 
-import pandas as pd
-
 _COLUMNS = [
     "timestamp",
     "event_type",
@@ -22,12 +21,16 @@ _COLUMNS = [
 
 
 class EventStore:
-    """Accumulates takeoff/landing events in a pandas DataFrame."""
+    """Accumulates takeoff/landing events in a list of row dicts.
+
+    A DataFrame is only materialized on demand: appending to a list is O(1)
+    per event, whereas pd.concat copied the whole frame on every record.
+    """
 
     def __init__(self, airport: str = "", logs_dir: str | None = None):
         self.airport = airport.upper()
         self.logs_dir = logs_dir
-        self._df = pd.DataFrame(columns=_COLUMNS)
+        self.events: list[dict] = []
 
     def record_event(self, event: dict):
         """Append a single event dict (from AircraftMonitor) to the store."""
@@ -47,10 +50,27 @@ class EventStore:
             "category": event.get("category"),
             "origin_country": event.get("origin_country"),
         }
-        self._df = pd.concat([self._df, pd.DataFrame([row])], ignore_index=True)
+        self.events.append(row)
+
+    def get_dataframe(self) -> "pd.DataFrame":
+        """Events as a DataFrame, for analysis consumers.
+
+        The events list is the canonical store; nothing on the recording
+        or export paths needs pandas, so the import is deferred until a
+        caller actually asks for a frame.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.events, columns=_COLUMNS)
+
+    def iter_events(self) -> list[dict]:
+        """The raw event row dicts, oldest first.
 
-    def get_dataframe(self) -> pd.DataFrame:
-        return self._df.copy()
+        Read paths should prefer this over get_dataframe(): it hands back
+        the live list with no DataFrame materialization or per-row
+        boxing. Callers must not mutate the rows.
+        """
+        return self.events
 
     def save_csv(self, path: str | None = None) -> str:
         """Write events to CSV. Returns the path written."""
@@ -61,11 +81,15 @@ class EventStore:
                 path = os.path.join(self.logs_dir, filename)
             else:
                 path = os.path.join(os.getcwd(), "logs", filename)
-        self._df.to_csv(path, index=False)
+        # Stream rows straight from the buffer; no DataFrame detour needed
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.events)
         return path
 
     def clear(self):
-        self._df = pd.DataFrame(columns=_COLUMNS)
+        self.events = []
 
     def __len__(self) -> int:
-        return len(self._df)
+        return len(self.events)
@@ -7,17 +7,40 @@ and a glossary mapping type codes to their full make/model/notes.
 
 import json
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
 logger = logging.getLogger(__name__)
 
+# Default data directory, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
 
 class AircraftType:
     """Represents a single aircraft type in the glossary."""
 
+    __slots__ = ("code", "make", "model", "notes")
+
     def __init__(self, code: str, make: str = "", model: str = "", notes: str = ""):
-        self.code = code.upper()
+        # Codes loaded from disk are stored uppercase already; skip the
+        # re-allocation in that common case
+        self.code = code if code.isupper() else code.upper()
         self.make = make
         self.model = model
         self.notes = notes
@@ -58,17 +81,61 @@ class GroupsDatabase:
         if db_path is None:
             if data_dir is None:
                 # Default to glycol/data/type_groups.json
-                data_dir = Path(__file__).parent / "data"
+                data_dir = _DATA_DIR
             db_path = Path(data_dir) / "type_groups.json"
         else:
             db_path = Path(db_path)
 
         self.db_path = db_path
         self.groups: Dict[str, List[str]] = {}
-        self.glossary: Dict[str, AircraftType] = {}
+        # Raw glossary rows straight from JSON; AircraftType instances are
+        # only materialized on first access through the glossary property
+        self._glossary_raw: Dict[str, Dict] = {}
+        self._glossary: Optional[Dict[str, AircraftType]] = None
+        self._defer_depth = 0
+        self._dirty = False
+        # code -> lowercased "code\nmake\nmodel\nnotes" blob, built lazily on
+        # first search and dropped whenever the glossary changes
+        self._search_blobs: Optional[Dict[str, str]] = None
+        # (mtime_ns, size) of the file backing the in-memory state; load()
+        # skips the JSON reparse while this still matches the file on disk
+        self._loaded_stat: Optional[tuple] = None
         self._ensure_db_exists()
         self.load()
 
+    @property
+    def glossary(self) -> Dict[str, AircraftType]:
+        """The type-code glossary, materialized lazily on first query."""
+        if self._glossary is None:
+            self._glossary = {
+                code: AircraftType.from_dict(code, details)
+                for code, details in self._glossary_raw.items()
+            }
+            self._glossary_raw = {}
+        return self._glossary
+
+    @glossary.setter
+    def glossary(self, value: Dict[str, AircraftType]):
+        self._glossary = value
+        self._glossary_raw = {}
+        self._search_blobs = None
+
+    @contextmanager
+    def batch(self):
+        """Coalesce all save() calls inside the block into one disk write.
+
+        Every mutator calls save(), so bulk edits rewrote the whole JSON
+        file once per change. Inside a batch() block saves only mark the
+        database dirty; the file is written once on exit.
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._dirty:
+                self.save()
+
     def _ensure_db_exists(self):
         """Create the database file if it doesn't exist."""
         if not self.db_path.exists():
@@ -79,42 +146,73 @@ class GroupsDatabase:
     def load(self):
         """Load groups and glossary from the database file."""
         try:
-            with open(self.db_path, "r") as f:
-                data = json.load(f)
+            stat = self.db_path.stat()
+            file_stat = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_stat = None
+        if file_stat is not None and file_stat == self._loaded_stat:
+            # File unchanged since the last load/save; in-memory state is current
+            return
+
+        self._search_blobs = None
+        try:
+            data = _loads(self.db_path.read_bytes())
 
             self.groups = data.get("groups", {})
 
-            # Load glossary
-            glossary_data = data.get("glossary", {})
-            self.glossary = {
-                code: AircraftType.from_dict(code, details)
-                for code, details in glossary_data.items()
-            }
+            # Defer glossary materialization until something queries it
+            self._glossary_raw = data.get("glossary", {})
+            self._glossary = None
 
+            self._loaded_stat = file_stat
             logger.info(
-                f"Loaded {len(self.groups)} groups and {len(self.glossary)} "
+                f"Loaded {len(self.groups)} groups and {len(self._glossary_raw)} "
                 f"aircraft types from glossary"
             )
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing groups database: {e}")
             self.groups = {}
             self.glossary = {}
+            self._loaded_stat = None
         except Exception as e:
             logger.error(f"Error loading groups database: {e}")
             self.groups = {}
             self.glossary = {}
+            self._loaded_stat = None
+
 
     def save(self):
         """Save groups and glossary to the database file."""
+        if self._defer_depth:
+            self._dirty = True
+            return
         try:
-            data = {
-                "groups": self.groups,
-                "glossary": {code: aircraft.to_dict() for code, aircraft in self.glossary.items()}
-            }
-            with open(self.db_path, "w") as f:
-                json.dump(data, f, indent=2)
+            if self._glossary is None:
+                # Never materialized: the raw rows are still authoritative
+                glossary_data = self._glossary_raw
+            else:
+                # Inline the row dicts: one literal per entry, no per-entry
+                # to_dict() method call
+                glossary_data = {
+                    code: {"make": a.make, "model": a.model, "notes": a.notes}
+                    for code, a in self._glossary.items()
+                }
+            data = {"groups": self.groups, "glossary": glossary_data}
+            # Write-then-rename: readers never see a half-written file and a
+            # crash mid-save leaves the old database intact. No fsync - the
+            # rename gives atomicity and the OS flushes in the background.
+            tmp = self.db_path.with_suffix(self.db_path.suffix + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(_dumps(data))
+            tmp.replace(self.db_path)
+            self._dirty = False
+            try:
+                stat = self.db_path.stat()
+                self._loaded_stat = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self._loaded_stat = None
             logger.info(
-                f"Saved {len(self.groups)} groups and {len(self.glossary)} "
+                f"Saved {len(self.groups)} groups and {len(glossary_data)} "
                 f"aircraft types to glossary"
             )
         except Exception as e:
@@ -160,16 +258,17 @@ class GroupsDatabase:
         Returns:
             True if added, False if group doesn't exist or code already in group.
         """
-        if group_name not in self.groups:
+        codes = self.groups.get(group_name)
+        if codes is None:
             logger.warning(f"Group '{group_name}' not found")
             return False
 
         aircraft_code = aircraft_code.upper()
-        if aircraft_code in self.groups[group_name]:
+        if aircraft_code in codes:
             logger.warning(f"Aircraft code {aircraft_code} already in group {group_name}")
             return False
 
-        self.groups[group_name].append(aircraft_code)
+        codes.append(aircraft_code)
         self.save()
         logger.info(f"Added {aircraft_code} to group {group_name}")
         return True
@@ -185,16 +284,19 @@ class GroupsDatabase:
         Returns:
             True if removed, False if group doesn't exist or code not in group.
         """
-        if group_name not in self.groups:
+        codes = self.groups.get(group_name)
+        if codes is None:
             logger.warning(f"Group '{group_name}' not found")
             return False
 
         aircraft_code = aircraft_code.upper()
-        if aircraft_code not in self.groups[group_name]:
+        try:
+            # One scan: remove() raises if absent, so skip the membership pre-check
+            codes.remove(aircraft_code)
+        except ValueError:
             logger.warning(f"Aircraft code {aircraft_code} not in group {group_name}")
             return False
 
-        self.groups[group_name].remove(aircraft_code)
         self.save()
         logger.info(f"Removed {aircraft_code} from group {group_name}")
         return True
@@ -238,6 +340,7 @@ class GroupsDatabase:
             return False
 
         self.glossary[aircraft.code] = aircraft
+        self._search_blobs = None
         self.save()
         logger.info(f"Added aircraft type: {aircraft.code}")
         return True
@@ -262,6 +365,7 @@ class GroupsDatabase:
             if hasattr(aircraft, key):
                 setattr(aircraft, key, value)
 
+        self._search_blobs = None
         self.save()
         logger.info(f"Updated aircraft type: {code}")
         return True
@@ -282,6 +386,7 @@ class GroupsDatabase:
             return False
 
         del self.glossary[code]
+        self._search_blobs = None
         self.save()
         logger.info(f"Removed aircraft type: {code}")
         return True
@@ -301,11 +406,14 @@ class GroupsDatabase:
             List of matching aircraft types.
         """
         query = query.lower()
-        results = []
-        for aircraft in self.glossary.values():
-            if (query in aircraft.code.lower() or
-                query in aircraft.make.lower() or
-                query in aircraft.model.lower() or
-                query in aircraft.notes.lower()):
-                results.append(aircraft)
-        return results
+        if self._search_blobs is None:
+            self._search_blobs = {
+                code: f"{a.code}\n{a.make}\n{a.model}\n{a.notes}".lower()
+                for code, a in self.glossary.items()
+            }
+        glossary = self.glossary
+        return [
+            glossary[code]
+            for code, blob in self._search_blobs.items()
+            if query in blob
+        ]
@@ -6,15 +6,40 @@ import secrets
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _encode_log(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _encode_log(obj: dict) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 class JsonFormatter(logging.Formatter):
     """
     Custom formatter that outputs log records as JSON.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cache the ISO timestamp down to the second; bursts of records
+        # within the same second only pay for the microsecond suffix
+        self._ts_second: int | None = None
+        self._ts_prefix = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.fromtimestamp(second).isoformat()
+        return f"{self._ts_prefix}.{int((created - second) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -31,7 +56,7 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return _encode_log(log_data)
 
 
 def setup_logging(log_file: str = None, logs_dir: str = None) -> str:
@@ -1,4 +1,7 @@
 import datetime
+import time
+
+_MISSING = object()  # sentinel: icao24 not seen in the previous poll
 
 
 class AircraftMonitor:
@@ -26,41 +29,88 @@ class AircraftMonitor:
         self.filter_values: list[str] = [
             v.strip().upper() for v in (filter_values or [])
         ]
+        # Frozen set views of filter_values for O(1) membership in the
+        # matchers; the lowercase twin lets the aircraft matcher test API
+        # strings (lowercase icao24s) without allocating an upper() copy
+        self._filter_set: frozenset[str] = frozenset(self.filter_values)
+        self._filter_set_lower: frozenset[str] = frozenset(
+            v.lower() for v in self.filter_values
+        )
+        # icao24 -> match result memo for type_group mode; the same airframes
+        # reappear poll after poll, so each one is resolved once per filter
+        self._type_match_cache: dict[str, bool] = {}
         self.ceiling_m: float | None = (
             ceiling_ft * self.FEET_TO_METERS if ceiling_ft is not None else None
         )
         self.icao_to_type: dict[str, str] = icao_to_type or {}
         # icao24 -> on_ground (bool)
         self._prev_states: dict[str, bool] = {}
+        # Cached event timestamp, refreshed at most once per wall-clock second
+        self._ts_second = -1
+        self._ts_iso = ""
 
     def set_filter(self, filter_mode: str | None, filter_values: list[str] | None = None):
         """Update the filter configuration."""
         self.filter_mode = filter_mode
         self.filter_values = [v.strip().upper() for v in (filter_values or [])]
+        self._filter_set = frozenset(self.filter_values)
+        self._filter_set_lower = frozenset(v.lower() for v in self.filter_values)
+        self._type_match_cache.clear()
 
     def _matches_filter(self, state: dict) -> bool:
         """Check if an aircraft state matches the current filter."""
-        # No filter - all traffic
+        # All-traffic fast path: no dispatch, no per-state work
         if self.filter_mode is None:
             return True
+        matcher = self.get_matcher()
+        return True if matcher is None else matcher(state)
 
-        # Aircraft filter - match by ICAO24, callsign, or tail number
-        if self.filter_mode == "aircraft":
-            icao24 = (state.get("icao24") or "").upper()
-            callsign = (state.get("callsign") or "").upper()
-            return icao24 in self.filter_values or callsign in self.filter_values
+    def get_matcher(self):
+        """Return the per-state match callable for the current filter mode.
 
-        # Type group filter - match by aircraft type code
+        None means "all traffic matches", so batch loops can skip the
+        per-state call entirely. Unknown modes default to allow. This is
+        the supported hook for consumers that filter a whole batch: one
+        call snapshots the mode dispatch instead of re-resolving it (and
+        the filter attributes behind it) per state.
+        """
+        if self.filter_mode == "aircraft":
+            return self._matches_aircraft
         if self.filter_mode == "type_group":
-            # Look up aircraft type code from ICAO24
-            icao24 = (state.get("icao24") or "").lower()
-            type_code = self.icao_to_type.get(icao24)
-            if type_code:
-                return type_code.upper() in self.filter_values
-            return False
-
-        # Unknown filter mode - default to allow
-        return True
+            return self._matches_type_group
+        return None
+
+    def _matches_aircraft(self, state: dict) -> bool:
+        """Match by ICAO24, callsign, or tail number."""
+        # API icao24s are already lowercase: probe the lowercase set first
+        # and only pay for an upper() copy on a miss
+        icao24 = state.get("icao24") or ""
+        if icao24 in self._filter_set_lower:
+            return True
+        fset = self._filter_set
+        if icao24.upper() in fset:
+            return True
+        # Callsigns come back uppercase from the API
+        callsign = state.get("callsign") or ""
+        return callsign in fset or callsign.upper() in fset
+
+    def _matches_type_group(self, state: dict) -> bool:
+        """Match by aircraft type code looked up from ICAO24."""
+        raw = state.get("icao24") or ""
+        cached = self._type_match_cache.get(raw)
+        if cached is not None:
+            return cached
+        type_code = self.icao_to_type.get(raw.lower())
+        if type_code:
+            # ICAO24_TO_TYPE stores uppercased codes already; only re-case
+            # type maps that weren't normalized
+            if not type_code.isupper():
+                type_code = type_code.upper()
+            result = type_code in self._filter_set
+        else:
+            result = False
+        self._type_match_cache[raw] = result
+        return result
 
     def process_states(self, states: list[dict], airport: str = "") -> list[dict]:
         """Process a batch of state vectors and return detected events.
@@ -69,32 +119,61 @@ class AircraftMonitor:
         all other state vector fields.
         """
         events: list[dict] = []
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+        # Quiet-airport fast path: nothing in the bbox, nothing to diff
+        if not states:
+            self._prev_states = {}
+            return events
+
+        # time.time() + a per-second ISO cache: event consumers only display
+        # second precision, so skip datetime construction within the same second
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_iso = datetime.datetime.fromtimestamp(
+                second, datetime.timezone.utc
+            ).isoformat()
+        now = self._ts_iso
+
         current: dict[str, bool] = {}
 
+        # Resolve the filter-mode dispatch once per batch instead of
+        # re-branching on filter_mode for every state; run the cheap numeric
+        # ceiling gate before the Python-level matcher call.
+        matcher = self.get_matcher()
+        # Specialize the loop on whether a ceiling is configured at all:
+        # unlimited monitors skip the altitude fetch and compare entirely
+        ceiling = self.ceiling_m
+        has_ceiling = ceiling is not None
+        # Bind loop-invariant lookups to locals once per batch
+        prev_get = self._prev_states.get
+        make_event = self._make_event
+        append = events.append
+
         for state in states:
-            if not self._matches_filter(state):
-                continue
+            get = state.get
 
-            if self.ceiling_m is not None:
-                alt = state.get("baro_altitude")
-                if alt is not None and alt > self.ceiling_m:
+            if has_ceiling:
+                alt = get("baro_altitude")
+                if alt is not None and alt > ceiling:
                     continue
 
-            icao24 = state.get("icao24", "")
-            on_ground = state.get("on_ground", False)
+            if matcher is not None and not matcher(state):
+                continue
+
+            icao24 = get("icao24", "")
+            on_ground = get("on_ground", False)
             current[icao24] = on_ground
 
-            if icao24 in self._prev_states:
-                was_ground = self._prev_states[icao24]
-                if was_ground and not on_ground:
-                    events.append(self._make_event("takeoff", state, now, airport))
-                elif not was_ground and on_ground:
-                    events.append(self._make_event("landing", state, now, airport))
-            else:
+            was_ground = prev_get(icao24, _MISSING)
+            if was_ground is _MISSING:
                 # New aircraft in bounding box
                 etype = "new_ground" if on_ground else "new_airborne"
-                events.append(self._make_event(etype, state, now, airport))
+                append(make_event(etype, state, now, airport))
+            elif was_ground and not on_ground:
+                append(make_event("takeoff", state, now, airport))
+            elif not was_ground and on_ground:
+                append(make_event("landing", state, now, airport))
 
         self._prev_states = current
         return events
@@ -105,20 +184,23 @@ class AircraftMonitor:
 
     @staticmethod
     def _make_event(event_type: str, state: dict, timestamp: str, airport: str = "") -> dict:
+        # Bind the bound method once; the dict literal then does one fast
+        # local call per field instead of re-resolving state.get each time
+        get = state.get
         return {
             "type": event_type,
             "timestamp": timestamp,
-            "icao24": state.get("icao24", ""),
-            "callsign": state.get("callsign", ""),
+            "icao24": get("icao24", ""),
+            "callsign": get("callsign", ""),
             "airport": airport,
-            "latitude": state.get("latitude"),
-            "longitude": state.get("longitude"),
-            "altitude_m": state.get("baro_altitude"),
-            "velocity_ms": state.get("velocity"),
-            "heading": state.get("true_track"),
-            "vertical_rate": state.get("vertical_rate"),
-            "on_ground": state.get("on_ground"),
-            "squawk": state.get("squawk"),
-            "category": state.get("category"),
-            "origin_country": state.get("origin_country"),
+            "latitude": get("latitude"),
+            "longitude": get("longitude"),
+            "altitude_m": get("baro_altitude"),
+            "velocity_ms": get("velocity"),
+            "heading": get("true_track"),
+            "vertical_rate": get("vertical_rate"),
+            "on_ground": get("on_ground"),
+            "squawk": get("squawk"),
+            "category": get("category"),
+            "origin_country": get("origin_country"),
         }
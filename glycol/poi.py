@@ -7,15 +7,46 @@ tail number, ICAO24 address, make/model, and notes.
 
 import json
 import logging
+import os
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - orjson is optional
+    # Share one decoder/encoder: json.loads/dumps construct fresh ones
+    # (and re-parse their options) on every call
+    _DECODER = json.JSONDecoder()
+    _ENCODER = json.JSONEncoder(indent=2)
+
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode()
+        return _DECODER.decode(data)
+
+    def _dumps(obj) -> bytes:
+        return _ENCODER.encode(obj).encode()
+
+
 logger = logging.getLogger(__name__)
 
+# Default data directory, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
 
 class PlaneOfInterest:
     """Represents a single plane of interest."""
 
+    __slots__ = ("tailnumber", "name", "icao24", "make_model", "notes")
+
     def __init__(
         self,
         tailnumber: str,
@@ -24,12 +55,15 @@ class PlaneOfInterest:
         make_model: str = "",
         notes: str = "",
     ):
-        self.tailnumber = tailnumber.upper()  # Tail numbers typically uppercase
+        # Tail numbers typically uppercase; ICAO24 addresses are
+        # case-insensitive. Both serve as index keys, so intern them -
+        # interned dict keys compare by pointer, and reloads share one
+        # str object per plane instead of allocating fresh copies.
+        self.tailnumber = sys.intern(tailnumber.upper())
         self.name = name
-        self.icao24 = (
-            icao24.lower() if icao24 else ""
-        )  # ICAO24 addresses are case-insensitive
-        self.make_model = make_model
+        self.icao24 = sys.intern(icao24.lower()) if icao24 else ""
+        # Many planes share a make/model; collapse duplicates to one object
+        self.make_model = sys.intern(make_model) if make_model else ""
         self.notes = notes
 
     def to_dict(self) -> Dict:
@@ -45,13 +79,20 @@ class PlaneOfInterest:
     @classmethod
     def from_dict(cls, data: Dict) -> "PlaneOfInterest":
         """Create from dictionary."""
-        return cls(
-            tailnumber=data.get("tailnumber", ""),
-            name=data.get("name", ""),
-            icao24=data.get("icao24", ""),
-            make_model=data.get("make_model", ""),
-            notes=data.get("notes", ""),
-        )
+        try:
+            # Rows written by save() carry exactly the constructor's
+            # fields, so ** unpacking binds them in one C call; the
+            # five-.get() path only runs for hand-edited rows with
+            # missing or extra keys
+            return cls(**data)
+        except TypeError:
+            return cls(
+                tailnumber=data.get("tailnumber", ""),
+                name=data.get("name", ""),
+                icao24=data.get("icao24", ""),
+                make_model=data.get("make_model", ""),
+                notes=data.get("notes", ""),
+            )
 
     def __repr__(self):
         return f"PlaneOfInterest(name={self.name}, icao24={self.icao24}, tailnumber={self.tailnumber})"
@@ -65,6 +106,7 @@ class POIDatabase:
         db_path: Optional[Path] = None,
         data_dir: Optional[Path] = None,
         category: str = "default",
+        durable: bool = False,
     ):
         """
         Initialize the POI database.
@@ -73,21 +115,59 @@ class POIDatabase:
             db_path: Path to the JSON database file. If None, uses default location.
             data_dir: Directory containing data files. If provided, db_path is relative to this.
             category: Which category/dictionary to use (default: "default").
+            durable: If True, fsync the directory after each save. The
+                write-then-rename in save() already guarantees atomicity;
+                this additionally forces the rename to stable storage, at
+                the cost of an fsync per save.
         """
         if db_path is None:
             if data_dir is None:
                 # Default to glycol/data/planes_of_interest.json
-                data_dir = Path(__file__).parent / "data"
+                data_dir = _DATA_DIR
             db_path = Path(data_dir) / "planes_of_interest.json"
         else:
             db_path = Path(db_path)
 
         self.db_path = db_path
         self.category = category
+        self.durable = durable
         self.planes: List[PlaneOfInterest] = []
+        # Hash indexes over self.planes so lookups are one dict probe
+        # instead of a scan of the whole list
+        self._by_icao24: Dict[str, PlaneOfInterest] = {}
+        self._by_tail: Dict[str, PlaneOfInterest] = {}
+        self._pos: Dict[str, int] = {}
+        self._defer_depth = 0
+        self._dirty = False
+        # Hash of the last payload written; no-op mutations (e.g. update()
+        # with unchanged values) then skip the disk write entirely
+        self._last_hash: Optional[int] = None
         self._ensure_db_exists()
         self.load()
 
+    @contextmanager
+    def batch(self):
+        """Coalesce all save() calls inside the block into one disk write.
+
+        add/update/remove each rewrite the whole JSON file; inside a
+        batch() block saves only mark the database dirty and the file is
+        written once on exit.
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._dirty:
+                self.save()
+
+    def _reindex(self):
+        """Rebuild the icao24/tailnumber indexes from self.planes."""
+        self._by_icao24 = {p.icao24: p for p in self.planes if p.icao24}
+        self._by_tail = {p.tailnumber: p for p in self.planes if p.tailnumber}
+        # icao24 -> list position, so remove() needs no scan at all
+        self._pos = {p.icao24: i for i, p in enumerate(self.planes) if p.icao24}
+
     def _ensure_db_exists(self):
         """Create the database file if it doesn't exist."""
         if not self.db_path.exists():
@@ -97,46 +177,51 @@ class POIDatabase:
 
     def load(self):
         """Load planes from the database file."""
+        # The file may have changed under us; don't trust the old hash
+        self._last_hash = None
         try:
-            with open(self.db_path, "r") as f:
-                data = json.load(f)
-
-                # Handle old list format (migrate to new dict format)
-                if isinstance(data, list):
-                    logger.warning(
-                        "Migrating old POI database format to new dictionary structure"
-                    )
-                    migrated_data = {"default": data, "example": []}
-                    with open(self.db_path, "w") as fw:
-                        json.dump(migrated_data, fw, indent=2)
-                    data = migrated_data
-
-                # Load from specified category
-                if self.category not in data:
-                    logger.warning(
-                        f"Category '{self.category}' not found, creating empty category"
-                    )
-                    data[self.category] = []
-
-                self.planes = [
-                    PlaneOfInterest.from_dict(p) for p in data[self.category]
-                ]
-                logger.info(
-                    f"Loaded {len(self.planes)} planes of interest from category '{self.category}'"
+            data = _loads(self.db_path.read_bytes())
+
+            # Handle old list format (migrate to new dict format)
+            if isinstance(data, list):
+                logger.warning(
+                    "Migrating old POI database format to new dictionary structure"
                 )
+                migrated_data = {"default": data, "example": []}
+                self.db_path.write_bytes(_dumps(migrated_data))
+                data = migrated_data
+
+            # Load from specified category
+            if self.category not in data:
+                logger.warning(
+                    f"Category '{self.category}' not found, creating empty category"
+                )
+                data[self.category] = []
+
+            self.planes = [
+                PlaneOfInterest.from_dict(p) for p in data[self.category]
+            ]
+            self._reindex()
+            logger.info(
+                f"Loaded {len(self.planes)} planes of interest from category '{self.category}'"
+            )
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing POI database: {e}")
             self.planes = []
+            self._reindex()
         except Exception as e:
             logger.error(f"Error loading POI database: {e}")
             self.planes = []
+            self._reindex()
 
     def save(self):
         """Save planes to the database file."""
+        if self._defer_depth:
+            self._dirty = True
+            return
         try:
             # Load all categories first to preserve them
-            with open(self.db_path, "r") as f:
-                all_data = json.load(f)
+            all_data = _loads(self.db_path.read_bytes())
 
             # If it's still in old list format, convert it
             if isinstance(all_data, list):
@@ -145,9 +230,27 @@ class POIDatabase:
             # Update only our category
             all_data[self.category] = [p.to_dict() for p in self.planes]
 
-            # Save everything back
-            with open(self.db_path, "w") as f:
-                json.dump(all_data, f, indent=2)
+            payload = _dumps(all_data)
+            h = hash(payload)
+            if h == self._last_hash:
+                # Nothing actually changed since the last write
+                self._dirty = False
+                return
+
+            # Write-then-rename so readers never see a half-written file
+            # and a crash mid-save leaves the old database intact
+            tmp = self.db_path.with_suffix(self.db_path.suffix + ".tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(self.db_path)
+            if self.durable:
+                # Force the rename itself to stable storage
+                fd = os.open(self.db_path.parent, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._last_hash = h
+            self._dirty = False
             logger.info(
                 f"Saved {len(self.planes)} planes of interest to category '{self.category}'"
             )
@@ -169,25 +272,24 @@ class POIDatabase:
             return False
 
         self.planes.append(plane)
+        if plane.icao24:
+            self._by_icao24[plane.icao24] = plane
+            self._pos[plane.icao24] = len(self.planes) - 1
+        if plane.tailnumber:
+            self._by_tail[plane.tailnumber] = plane
         self.save()
         logger.info(f"Added plane: {plane}")
         return True
 
     def get_by_icao24(self, icao24: str) -> Optional[PlaneOfInterest]:
         """Get a plane by its ICAO24 address."""
-        icao24 = icao24.lower()
-        for plane in self.planes:
-            if plane.icao24 == icao24:
-                return plane
-        return None
+        # Index keys are lowercase and callers mostly pass lowercase
+        # already; only pay for the re-cased copy on a miss
+        return self._by_icao24.get(icao24) or self._by_icao24.get(icao24.lower())
 
     def get_by_tailnumber(self, tailnumber: str) -> Optional[PlaneOfInterest]:
         """Get a plane by its tail number."""
-        tailnumber = tailnumber.upper()
-        for plane in self.planes:
-            if plane.tailnumber == tailnumber:
-                return plane
-        return None
+        return self._by_tail.get(tailnumber) or self._by_tail.get(tailnumber.upper())
 
     def update(self, icao24: str, **kwargs) -> bool:
         """
@@ -205,10 +307,57 @@ class POIDatabase:
             logger.warning(f"Plane with ICAO24 {icao24} not found")
             return False
 
+        old_tail = plane.tailnumber
+        for key, value in kwargs.items():
+            if hasattr(plane, key):
+                setattr(plane, key, value)
+
+        # Re-key the tail index if the tail number changed
+        if plane.tailnumber != old_tail:
+            self._by_tail.pop(old_tail, None)
+            if plane.tailnumber:
+                self._by_tail[plane.tailnumber] = plane
+
+        self.save()
+        logger.info(f"Updated plane: {plane}")
+        return True
+
+    def update_by_tailnumber(self, tailnumber: str, **kwargs) -> bool:
+        """
+        Update a plane's details, keyed by tail number.
+
+        Args:
+            tailnumber: Tail number of the plane to update.
+            **kwargs: Fields to update (name, icao24, make_model, notes).
+
+        Returns:
+            True if updated, False if not found.
+        """
+        plane = self.get_by_tailnumber(tailnumber)
+        if not plane:
+            logger.warning(f"Plane with tail number {tailnumber} not found")
+            return False
+
+        old_icao = plane.icao24
         for key, value in kwargs.items():
             if hasattr(plane, key):
+                if key == "icao24":
+                    # Same normalization the constructor applies; icao24
+                    # is an index key
+                    value = sys.intern(value.lower()) if value else ""
                 setattr(plane, key, value)
 
+        # Re-key the icao24 indexes if the address changed
+        if plane.icao24 != old_icao:
+            if old_icao:
+                i = self._pos.pop(old_icao)
+                self._by_icao24.pop(old_icao, None)
+            else:
+                i = self.planes.index(plane)
+            if plane.icao24:
+                self._pos[plane.icao24] = i
+                self._by_icao24[plane.icao24] = plane
+
         self.save()
         logger.info(f"Updated plane: {plane}")
         return True
@@ -228,7 +377,51 @@ class POIDatabase:
             logger.warning(f"Plane with ICAO24 {icao24} not found")
             return False
 
-        self.planes.remove(plane)
+        # Swap-pop at the indexed position: O(1) instead of list.remove's
+        # scan plus element shift. Order within a category carries no
+        # meaning - lookups all go through the hash indexes.
+        i = self._pos.pop(plane.icao24)
+        last = self.planes.pop()
+        if i < len(self.planes):
+            self.planes[i] = last
+            if last.icao24:
+                self._pos[last.icao24] = i
+        self._by_icao24.pop(plane.icao24, None)
+        self._by_tail.pop(plane.tailnumber, None)
+        self.save()
+        logger.info(f"Removed plane: {plane}")
+        return True
+
+    def remove_by_tailnumber(self, tailnumber: str) -> bool:
+        """
+        Remove a plane from the database, keyed by tail number.
+
+        Args:
+            tailnumber: Tail number of the plane to remove.
+
+        Returns:
+            True if removed, False if not found.
+        """
+        plane = self.get_by_tailnumber(tailnumber)
+        if not plane:
+            logger.warning(f"Plane with tail number {tailnumber} not found")
+            return False
+
+        if plane.icao24:
+            # Indexed swap-pop path
+            return self.remove(plane.icao24)
+
+        # No icao24 means no position index entry; this rare case still
+        # needs a scan to locate the plane (identity comparisons, since
+        # PlaneOfInterest defines no __eq__), but the removal itself is
+        # the same swap-pop as remove() - no element shifting
+        i = self.planes.index(plane)
+        last = self.planes.pop()
+        if i < len(self.planes):
+            self.planes[i] = last
+            if last.icao24:
+                self._pos[last.icao24] = i
+        self._by_tail.pop(plane.tailnumber, None)
         self.save()
         logger.info(f"Removed plane: {plane}")
         return True
@@ -248,8 +441,7 @@ class POIDatabase:
     def list_categories(self) -> List[str]:
         """Get a list of all available categories in the database."""
         try:
-            with open(self.db_path, "r") as f:
-                data = json.load(f)
+            data = _loads(self.db_path.read_bytes())
             if isinstance(data, dict):
                 return list(data.keys())
             return ["default"]
@@ -264,6 +456,13 @@ class POIDatabase:
         Args:
             category: The category name to switch to.
         """
+        # Flush any deferred edits before rebinding: a save still pending
+        # from an enclosing batch() would otherwise be written against the
+        # new category (or lost entirely).
+        if self._dirty and self._defer_depth:
+            depth, self._defer_depth = self._defer_depth, 0
+            self.save()
+            self._defer_depth = depth
         self.category = category
         self.load()
         logger.info(f"Switched to category '{category}'")
@@ -3,7 +3,7 @@
 const state = {
     isPolling: false,
     eventSource: null,
-    aircraftData: [],
+    aircraftByIcao: new Map(),
     events: []
 };
 
@@ -167,7 +167,7 @@ function connectEventStream() {
 function handleServerEvent(message) {
     switch (message.type) {
         case 'aircraft_update':
-            updateAircraftTable(message.data.aircraft);
+            applyAircraftUpdate(message.data);
             break;
         case 'new_events':
             addEvents(message.data.events);
@@ -178,8 +178,20 @@ function handleServerEvent(message) {
     }
 }
 
-function updateAircraftTable(aircraft) {
-    state.aircraftData = aircraft;
+function applyAircraftUpdate(data) {
+    // Server sends a full snapshot on (re)connect, then per-poll diffs
+    // keyed by icao24
+    if (data.full) {
+        state.aircraftByIcao = new Map(data.aircraft.map(ac => [ac.icao24, ac]));
+    } else {
+        (data.upsert || []).forEach(ac => state.aircraftByIcao.set(ac.icao24, ac));
+        (data.removed || []).forEach(icao24 => state.aircraftByIcao.delete(icao24));
+    }
+    renderAircraftTable();
+}
+
+function renderAircraftTable() {
+    const aircraft = [...state.aircraftByIcao.values()];
 
     if (aircraft.length === 0) {
         aircraftTbody.innerHTML = '<tr><td colspan="5" class="no-data">No aircraft in range</td></tr>';
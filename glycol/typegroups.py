@@ -5,19 +5,28 @@ Manages a JSON database of aircraft type groups (passenger, cargo, military, etc
 and a glossary mapping type codes to their full make/model/notes.
 """
 
+import bisect
 import json
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Default data directory, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
 
 class AircraftType:
     """Represents a single aircraft type in the glossary."""
 
+    __slots__ = ("code", "make", "model", "notes")
+
     def __init__(self, code: str, make: str = "", model: str = "", notes: str = ""):
-        self.code = code.upper()
+        # Codes loaded from disk are stored uppercase already; skip the
+        # re-allocation in that common case
+        self.code = code if code.isupper() else code.upper()
         self.make = make
         self.model = model
         self.notes = notes
@@ -54,7 +63,7 @@ class TypeGroupsDatabase:
         if db_path is None:
             if data_dir is None:
                 # Default to glycol/data/type_groups.json
-                data_dir = Path(__file__).parent / "data"
+                data_dir = _DATA_DIR
             db_path = Path(data_dir) / "type_groups.json"
         else:
             db_path = Path(db_path)
@@ -62,6 +71,14 @@ class TypeGroupsDatabase:
         self.db_path = db_path
         self.groups: Dict[str, List[str]] = {}
         self.glossary: Dict[str, AircraftType] = {}
+        # Mutation counter backing the sorted_groups() memo; every mutating
+        # method bumps it so cached views know when to rebuild
+        self._version = 0
+        self._sorted_groups_cache: tuple = (-1, [])
+        # batch() support: saves inside a batch only mark the database
+        # dirty and the file is written once on exit
+        self._defer_depth = 0
+        self._dirty = False
         self._ensure_db_exists()
         self.load()
 
@@ -74,11 +91,20 @@ class TypeGroupsDatabase:
 
     def load(self):
         """Load groups and glossary from the database file."""
+        self._version += 1
         try:
             with open(self.db_path, "r") as f:
                 data = json.load(f)
 
-            self.groups = data.get("groups", {})
+            # Keep each membership list sorted so group views can iterate
+            # in display order without re-sorting; inserts maintain the
+            # invariant via bisect.insort
+            # Empty and single-code groups (the common case) are sorted by
+            # definition; skip the sort call for them
+            self.groups = {
+                name: codes if len(codes) <= 1 else sorted(codes)
+                for name, codes in data.get("groups", {}).items()
+            }
 
             # Load glossary
             glossary_data = data.get("glossary", {})
@@ -100,8 +126,27 @@ class TypeGroupsDatabase:
             self.groups = {}
             self.glossary = {}
 
+    @contextmanager
+    def batch(self):
+        """Coalesce all save() calls inside the block into one disk write.
+
+        Every mutating method rewrites the whole JSON file; inside a
+        batch() block saves only mark the database dirty and the file is
+        written once on exit.
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._dirty:
+                self.save()
+
     def save(self):
         """Save groups and glossary to the database file."""
+        if self._defer_depth:
+            self._dirty = True
+            return
         try:
             data = {
                 "groups": self.groups,
@@ -111,6 +156,7 @@ class TypeGroupsDatabase:
             }
             with open(self.db_path, "w") as f:
                 json.dump(data, f, indent=2)
+            self._dirty = False
             logger.info(
                 f"Saved {len(self.groups)} groups and {len(self.glossary)} "
                 f"aircraft types to glossary"
@@ -123,8 +169,22 @@ class TypeGroupsDatabase:
         """Get a list of all group names."""
         return list(self.groups.keys())
 
+    def sorted_groups(self) -> List[str]:
+        """Group names in sorted order, memoized until the next mutation.
+
+        The interactive menus re-render this list on every iteration;
+        checking the version counter makes the steady-state call an O(1)
+        cache hit instead of a re-sort. Callers must not mutate the
+        returned list.
+        """
+        version, names = self._sorted_groups_cache
+        if version != self._version:
+            names = sorted(self.groups)
+            self._sorted_groups_cache = (self._version, names)
+        return names
+
     def get_group(self, group_name: str) -> Optional[List[str]]:
-        """Get aircraft codes in a group."""
+        """Get aircraft codes in a group, already in sorted order."""
         return self.groups.get(group_name)
 
     def create_group(
@@ -144,7 +204,14 @@ class TypeGroupsDatabase:
             logger.warning(f"Group '{group_name}' already exists")
             return False
 
-        self.groups[group_name] = aircraft_codes or []
+        if not aircraft_codes:
+            codes = []
+        elif len(aircraft_codes) == 1:
+            codes = list(aircraft_codes)
+        else:
+            codes = sorted(aircraft_codes)
+        self.groups[group_name] = codes
+        self._version += 1
         self.save()
         logger.info(f"Created group: {group_name}")
         return True
@@ -171,7 +238,8 @@ class TypeGroupsDatabase:
             )
             return False
 
-        self.groups[group_name].append(aircraft_code)
+        bisect.insort(self.groups[group_name], aircraft_code)
+        self._version += 1
         self.save()
         logger.info(f"Added {aircraft_code} to group {group_name}")
         return True
@@ -197,6 +265,7 @@ class TypeGroupsDatabase:
             return False
 
         self.groups[group_name].remove(aircraft_code)
+        self._version += 1
         self.save()
         logger.info(f"Removed {aircraft_code} from group {group_name}")
         return True
@@ -216,6 +285,7 @@ class TypeGroupsDatabase:
             return False
 
         del self.groups[group_name]
+        self._version += 1
         self.save()
         logger.info(f"Deleted group: {group_name}")
         return True
@@ -225,6 +295,17 @@ class TypeGroupsDatabase:
         """Get an aircraft type from the glossary."""
         return self.glossary.get(code.upper())
 
+    def get_aircraft_types_bulk(
+        self, codes: List[str]
+    ) -> Dict[str, Optional[AircraftType]]:
+        """Resolve many type codes at once; missing codes map to None.
+
+        One bound dict.get per code instead of a method call per code —
+        the group views resolve whole membership lists this way.
+        """
+        glossary_get = self.glossary.get
+        return {code: glossary_get(code if code.isupper() else code.upper()) for code in codes}
+
     def add_aircraft_type(self, aircraft: AircraftType) -> bool:
         """
         Add an aircraft type to the glossary.
@@ -240,6 +321,7 @@ class TypeGroupsDatabase:
             return False
 
         self.glossary[aircraft.code] = aircraft
+        self._version += 1
         self.save()
         logger.info(f"Added aircraft type: {aircraft.code}")
         return True
@@ -264,6 +346,7 @@ class TypeGroupsDatabase:
             if hasattr(aircraft, key):
                 setattr(aircraft, key, value)
 
+        self._version += 1
         self.save()
         logger.info(f"Updated aircraft type: {code}")
         return True
@@ -284,6 +367,7 @@ class TypeGroupsDatabase:
             return False
 
         del self.glossary[code]
+        self._version += 1
         self.save()
         logger.info(f"Removed aircraft type: {code}")
         return True
@@ -1,19 +1,54 @@
-import datetime
-import re
 import threading
+import time
 import tkinter as tk
 import webbrowser
 from tkinter import ttk, messagebox, filedialog, simpledialog
 
 from glycol.auth import OpenSkyAuth, load_credentials_from_file
 from glycol.api import OpenSkyClient
-from glycol.aircraft import REG_TO_ICAO24, ICAO24_TO_TYPE
+from glycol import aircraft
 from glycol.airports import get_bounding_box, airport_name
 from glycol.monitor import AircraftMonitor
 from glycol.events import EventStore
 from glycol.groups import GroupsDatabase
 
-_ICAO24_RE = re.compile(r"^[0-9a-fA-F]{6}$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+# Bound method: skips the attribute lookup on every call
+_is_hex = _HEX_DIGITS.issuperset
+
+
+def _is_icao24(t: str) -> bool:
+    """True if *t* is a 6-digit hex ICAO24 address.
+
+    A length check plus one C-level set containment beats spinning up the
+    regex engine for fixed-width 6-char tokens.
+    """
+    return len(t) == 6 and _is_hex(t)
+
+
+# Pre-warm the aircraft maps on a background thread so the window comes up
+# while the registration database loads; the maps are only needed once the
+# user clicks Start, which waits on this event.
+_AIRCRAFT_READY = threading.Event()
+_AIRCRAFT_LOAD_ERROR: Exception | None = None
+
+
+def _warm_aircraft_maps():
+    # Touching the attributes drives aircraft.py's lazy loader, which
+    # caches the maps in that module's globals
+    global _AIRCRAFT_LOAD_ERROR
+    try:
+        aircraft.REG_TO_ICAO24
+        aircraft.ICAO24_TO_TYPE
+    except Exception as e:
+        # Remember the failure for _start_polling; dying with the event
+        # unset would leave Start blocked on it forever
+        _AIRCRAFT_LOAD_ERROR = e
+    finally:
+        _AIRCRAFT_READY.set()
+
+
+threading.Thread(target=_warm_aircraft_maps, daemon=True).start()
 
 
 class CredentialsDialog(simpledialog.Dialog):
@@ -37,6 +72,11 @@ class CredentialsDialog(simpledialog.Dialog):
 class GlycolApp:
     """Main Tkinter application for Glycol airport monitoring."""
 
+    # Event-log cap: Tk Text insert cost grows with widget size, so an
+    # unbounded log slowly degrades (and leaks memory) over a long
+    # monitoring session. Oldest lines are dropped past this point.
+    MAX_LOG_LINES = 2000
+
     def __init__(
         self,
         root: tk.Tk,
@@ -61,11 +101,48 @@ class GlycolApp:
         self.auth: OpenSkyAuth | None = None
         self.client: OpenSkyClient | None = None
         self.groups_db = GroupsDatabase(data_dir=data_dir)
-        self.monitor = AircraftMonitor(filter_mode=None, icao_to_type=ICAO24_TO_TYPE)
+        # icao_to_type is attached in _start_polling once the background
+        # map load has finished
+        self.monitor = AircraftMonitor(filter_mode=None)
         self.store = EventStore(logs_dir=logs_dir)
         self._polling = False
         self._poll_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        # Plain-int mirror of poll_var for the worker thread: IntVar.get()
+        # crosses into Tcl and isn't safe off the Tk thread
+        self._poll_interval_s = max(1, int(poll_interval))
+        # Latest poll result plus a pending flag so UI refreshes coalesce:
+        # if the Tk thread falls behind, queued polls collapse into one
+        # update of the newest payload instead of stacking callbacks
+        self._latest_payload: tuple[list[dict], list[dict]] | None = None
+        self._update_pending = False
+        self._update_lock = threading.Lock()
+        # Resolved aircraft filters keyed by the raw filter tokens; the
+        # filter text rarely changes between Start clicks, so resolution
+        # (regex + registration lookups per token) runs once per distinct
+        # value instead of every time
+        self._aircraft_filter_cache: dict[
+            tuple[str, ...], tuple[list[str] | None, list[str]]
+        ] = {}
+        # Group-token -> expanded type codes, dropped when the groups DB
+        # file changes on disk
+        self._group_cache: dict[str, list[str]] = {}
+        self._group_cache_stat = None
+        # icao24 -> Treeview iid and last-displayed values, so table
+        # refreshes only touch rows that actually changed
+        self._row_iid: dict[str, str] = {}
+        self._row_values: dict[str, tuple] = {}
+        # Last (column, row) the mouse hovered, to gate the Motion handler
+        self._last_motion: tuple[str | None, str | None] = (None, None)
+        # icao24 -> type code memo for the event log; the same airframes
+        # trigger many events per session
+        self._type_cache: dict[str, str] = {}
+        # Lines currently in the event log, for the MAX_LOG_LINES cap
+        self._log_lines = 0
+        # Airport code/name pinned for the active session, so the status
+        # line doesn't re-read airport_var or re-resolve the name per poll
+        self._monitored_airport = ""
+        self._monitored_airport_name = ""
 
         self._build_menu()
         self._build_config_panel(airport, mode, filter_text)
@@ -82,13 +159,8 @@ class GlycolApp:
 
     @staticmethod
     def _dedupe_preserve_order(values: list[str]) -> list[str]:
-        seen: set[str] = set()
-        out: list[str] = []
-        for v in values:
-            if v not in seen:
-                seen.add(v)
-                out.append(v)
-        return out
+        # dict preserves insertion order and dedupes in one C pass
+        return list(dict.fromkeys(values))
 
     def _parse_filter_values(self) -> list[str]:
         return [v.strip() for v in self.filter_var.get().split(",") if v.strip()]
@@ -103,21 +175,33 @@ class GlycolApp:
         Returns:
             List of type codes to filter by (e.g., ["A388", "B738", ...])
         """
+        # Expansions are cached per token; invalidate when the groups DB
+        # has been reloaded from disk since the cache was filled
+        stat = self.groups_db._loaded_stat
+        if stat != self._group_cache_stat:
+            self._group_cache.clear()
+            self._group_cache_stat = stat
+
         type_codes: list[str] = []
+        cache = self._group_cache
+        get_group = self.groups_db.get_group
 
         for value in raw_values:
             value_upper = value.strip().upper()
             if not value_upper:
                 continue
 
-            # Check if it's a type group name (e.g., "passenger", "cargo")
-            group_types = self.groups_db.get_group(value_upper.lower())
-            if group_types:
-                # It's a type group - expand to all type codes in the group
-                type_codes.extend([t.upper() for t in group_types])
-            else:
-                # Assume it's an individual type code
-                type_codes.append(value_upper)
+            expansion = cache.get(value_upper)
+            if expansion is None:
+                # A type group name (e.g., "passenger") expands to all of
+                # its type codes; anything else is an individual type code
+                group_types = get_group(value_upper.lower())
+                if group_types:
+                    expansion = [t.upper() for t in group_types]
+                else:
+                    expansion = [value_upper]
+                cache[value_upper] = expansion
+            type_codes.extend(expansion)
 
         return self._dedupe_preserve_order(type_codes)
 
@@ -132,8 +216,17 @@ class GlycolApp:
         - monitor_filter_values: what the monitor should match against (ICAO24 + callsign + reg),
                                  normalized reasonably.
         """
+        key = tuple(raw_values)
+        cached = self._aircraft_filter_cache.get(key)
+        if cached is not None:
+            return cached
+
         api_icao24: list[str] = []
         monitor_values: list[str] = []
+        # The loader already normalizes this map to uppercase registrations
+        # and lowercase ICAO24s, so one get resolves a registration with no
+        # per-hit isinstance check or re-casing
+        reg_to_icao = aircraft.REG_TO_ICAO24.get
 
         for token in raw_values:
             t = token.strip()
@@ -141,7 +234,7 @@ class GlycolApp:
                 continue
 
             # 1) ICAO24 hex directly
-            if _ICAO24_RE.match(t):
+            if _is_icao24(t):
                 api_icao24.append(t.lower())
                 monitor_values.append(t.lower())
                 continue
@@ -150,10 +243,10 @@ class GlycolApp:
             reg = t.upper()
             monitor_values.append(reg)
 
-            icao = REG_TO_ICAO24.get(reg)
-            if isinstance(icao, str) and icao:
-                api_icao24.append(icao.lower())
-                monitor_values.append(icao.lower())
+            icao = reg_to_icao(reg)
+            if icao:
+                api_icao24.append(icao)
+                monitor_values.append(icao)
                 continue
 
             # 3) Otherwise treat as callsign (matched locally by monitor)
@@ -162,7 +255,9 @@ class GlycolApp:
         api_icao24 = self._dedupe_preserve_order(api_icao24)
         monitor_values = self._dedupe_preserve_order(monitor_values)
 
-        return (api_icao24 or None), monitor_values
+        result = ((api_icao24 or None), monitor_values)
+        self._aircraft_filter_cache[key] = result
+        return result
 
     # ---- UI construction ----
 
@@ -217,6 +312,7 @@ class GlycolApp:
             row=0, column=6, sticky=tk.W, padx=(12, 0)
         )
         self.poll_var = tk.IntVar(value=self.poll_interval)
+        self.poll_var.trace_add("write", self._on_poll_interval_change)
         ttk.Spinbox(frame, from_=5, to=120, textvariable=self.poll_var, width=5).grid(
             row=0, column=7, padx=4
         )
@@ -330,7 +426,7 @@ class GlycolApp:
             values = self.tree.item(item, "values")
             if values:
                 icao24 = values[0]  # ICAO24 is the first column
-                if icao24 and _ICAO24_RE.match(icao24):
+                if icao24 and _is_icao24(icao24):
                     # Go directly to ADSB-Exchange
                     url = f"https://globe.adsbexchange.com/?icao={icao24.lower()}"
                     webbrowser.open(url)
@@ -344,7 +440,7 @@ class GlycolApp:
             values = self.tree.item(item, "values")
             if values:
                 icao24 = values[0]
-                if icao24 and _ICAO24_RE.match(icao24):
+                if icao24 and _is_icao24(icao24):
                     # Create context menu
                     menu = tk.Menu(self.root, tearoff=0)
                     menu.add_command(
@@ -359,13 +455,19 @@ class GlycolApp:
 
     def _on_table_motion(self, event):
         """Show tooltip when hovering over ICAO24 column."""
+        # <Motion> fires on every pixel; the work below only needs to
+        # re-run when the hovered cell actually changes
+        column = self.tree.identify_column(event.x)
+        item = self.tree.identify_row(event.y)
+        if (column, item) == self._last_motion:
+            return
+        self._last_motion = (column, item)
+
         region = self.tree.identify_region(event.x, event.y)
         if region == "cell":
-            column = self.tree.identify_column(event.x)
             # Column #0 is the first visible column (ICAO24)
             if column == "#1":
                 self.tree.config(cursor="hand2")
-                item = self.tree.identify_row(event.y)
                 if item:
                     values = self.tree.item(item, "values")
                     if values and values[0]:
@@ -386,21 +488,18 @@ class GlycolApp:
 
     def _on_log_icao_click(self, event):
         """Handle click on ICAO24 link in event log."""
-        # Get the index of the click
+        # The handler is bound to the link tag, so the click index sits
+        # inside an icao24_link range; read the hex back from the widget
+        # instead of keeping one unique tag per ICAO24 (those accumulate
+        # in Tk's tag table for the life of the widget)
         index = self.log_text.index(f"@{event.x},{event.y}")
-
-        # Get all tags at this position
-        tags = self.log_text.tag_names(index)
-
-        # Find the ICAO24 tag (format: icao24_XXXXXX)
-        for tag in tags:
-            if tag.startswith("icao24_") and tag != "icao24_link":
-                icao24 = tag.split("_", 1)[1]
-                if _ICAO24_RE.match(icao24):
-                    # Go directly to ADSB-Exchange
-                    url = f"https://globe.adsbexchange.com/?icao={icao24.lower()}"
-                    webbrowser.open(url)
-                    break
+        rng = self.log_text.tag_prevrange("icao24_link", f"{index}+1c")
+        if rng:
+            icao24 = self.log_text.get(rng[0], rng[1])
+            if _is_icao24(icao24):
+                # Go directly to ADSB-Exchange
+                url = f"https://globe.adsbexchange.com/?icao={icao24.lower()}"
+                webbrowser.open(url)
 
     # ---- Credentials ----
 
@@ -466,6 +565,17 @@ class GlycolApp:
         display_to_mode = {"All Traffic": None, "Aircraft": "aircraft", "Type Group": "type_group"}
         filter_mode = display_to_mode.get(mode_display)
 
+        # Block only if the user beat the background loader to Start
+        _AIRCRAFT_READY.wait()
+        if _AIRCRAFT_LOAD_ERROR is not None:
+            messagebox.showerror(
+                "Glycol",
+                f"Aircraft database failed to load: {_AIRCRAFT_LOAD_ERROR}",
+            )
+            return
+        if not self.monitor.icao_to_type:
+            self.monitor.icao_to_type = aircraft.ICAO24_TO_TYPE
+
         raw_filt = self._parse_filter_values()
 
         # Compute the API filter and the monitor filter separately.
@@ -480,14 +590,30 @@ class GlycolApp:
             # Resolve type group names to type codes
             filt_for_monitor = self._resolve_group_filter(raw_filt)
 
+        # Reuse the store when the airport is unchanged and it's empty
+        # (Stop installs a fresh one after detaching the old store for the
+        # background save); otherwise start a new one for the new airport
+        if self.store.airport != airport or len(self.store):
+            self.store = EventStore(airport=airport, logs_dir=self.logs_dir)
+
         self.monitor.set_filter(filter_mode, filt_for_monitor)
         self.monitor.reset()
-        self.store = EventStore(airport=airport, logs_dir=self.logs_dir)
+        # Drop rows carried over from the previous session in one clear
+        # instead of letting the first poll diff against a stale table
+        if self._row_iid:
+            self.tree.delete(*self._row_iid.values())
+            self._row_iid.clear()
+            self._row_values.clear()
 
         self._polling = True
         self._stop_event.clear()
         self.start_btn.config(text="Stop")
-        self._set_status(f"Monitoring {airport_name(airport)} ({airport})")
+        # Pin the session's airport: the per-poll status line reuses these
+        # instead of re-reading the entry widget (which the user may edit
+        # mid-session) and re-resolving the display name
+        self._monitored_airport = airport
+        self._monitored_airport_name = airport_name(airport)
+        self._set_status(f"Monitoring {self._monitored_airport_name} ({airport})")
 
         if filter_mode == "aircraft":
             self._log(
@@ -507,74 +633,222 @@ class GlycolApp:
         )
         self._poll_thread.start()
 
-    def _stop_polling(self):
+    def _stop_polling(self, async_save: bool = True):
         self._polling = False
         self._stop_event.set()
         self.start_btn.config(text="Start")
         self._log("--- Stopped ---")
         if len(self.store):
-            path = self.store.save_csv()
-            self._log(f"Events saved to {path}")
+            if not async_save:
+                # Shutdown path: write synchronously so events aren't lost
+                # when the process exits
+                self._log(f"Events saved to {self.store.save_csv()}")
+                return
+            # Write the CSV off the Tk thread; a large store would
+            # otherwise freeze the UI for the duration of the save.
+            # Detach the store first so a quick Stop/Start can't mutate
+            # it under the background writer.
+            store = self.store
+            self.store = EventStore(airport=store.airport, logs_dir=self.logs_dir)
+
+            def _save():
+                path = store.save_csv()
+                self.root.after(0, self._log, f"Events saved to {path}")
+
+            threading.Thread(target=_save, daemon=True).start()
+
+    def _on_poll_interval_change(self, *_):
+        """Mirror poll_var into a plain int the worker thread can read."""
+        try:
+            self._poll_interval_s = max(1, int(self.poll_var.get()))
+        except (ValueError, tk.TclError):
+            # Spinbox text is transiently invalid while the user edits it
+            pass
 
     def _poll_loop(self, bbox, icao24_filter, airport=""):
-        while not self._stop_event.is_set():
+        stop = self._stop_event
+        # Monotonic deadlines keep the poll period honest regardless of how
+        # long the HTTP round trip takes
+        next_t = time.monotonic()
+        while not stop.is_set():
             try:
                 states = self.client.get_states(bbox, icao24_filter=icao24_filter)
                 events = self.monitor.process_states(states, airport=airport)
 
+                # Precompute the whole display row here on the worker
+                # thread so the Tk-thread table loop does no per-row
+                # string work at all - just the diff and the Tcl calls
+                for s in states:
+                    get = s.get
+                    ba = get("baro_altitude")
+                    ve = get("velocity")
+                    tt = get("true_track")
+                    vr = get("vertical_rate")
+                    s["_row"] = (
+                        get("icao24", ""),
+                        # callsigns are already stripped by api._parse_state
+                        get("callsign") or "",
+                        "-" if ba is None else f"{ba:.0f}",
+                        "-" if ve is None else f"{ve:.0f}",
+                        "-" if tt is None else f"{tt:.0f}",
+                        "-" if vr is None else f"{vr:.0f}",
+                        "Y" if get("on_ground") else "N",
+                        get("category", ""),
+                        get("origin_country", ""),
+                    )
+
                 for ev in events:
                     if ev["type"] in ("takeoff", "landing"):
                         self.store.record_event(ev)
-
-                self.root.after(0, self._update_ui, states, events)
+                    # Preformat the log line here so the Tk thread only
+                    # does widget inserts
+                    ev["_log_parts"] = self._format_event_parts(ev)
+
+                with self._update_lock:
+                    prev = self._latest_payload
+                    if prev is not None:
+                        # A refresh is still queued; keep its events so
+                        # none go unlogged, but show only the new states
+                        events = prev[1] + events
+                    self._latest_payload = (states, events)
+                    schedule = not self._update_pending
+                    self._update_pending = True
+                if schedule:
+                    # after_idle: the refresh runs once the Tk thread has
+                    # drained pending input events, so a busy UI absorbs
+                    # further polls into the slot instead of redrawing
+                    # between each queued click
+                    self.root.after_idle(self._dispatch_update)
             except Exception as exc:
                 self.root.after(0, self._log, f"Poll error: {exc}")
 
-            self._stop_event.wait(timeout=self.poll_var.get())
+            interval = self._poll_interval_s
+            next_t += interval
+            if next_t < time.monotonic():
+                # The poll overran the interval; realign rather than burst
+                next_t = time.monotonic()
+            # Wait in <=1s quanta: stop still interrupts instantly via
+            # the Event, and a Spinbox change mid-wait shifts the
+            # deadline instead of sleeping out the old interval first
+            while not stop.is_set():
+                if interval != self._poll_interval_s:
+                    next_t += self._poll_interval_s - interval
+                    interval = self._poll_interval_s
+                delay = next_t - time.monotonic()
+                if delay <= 0:
+                    break
+                stop.wait(timeout=delay if delay < 1.0 else 1.0)
 
     # ---- UI updates ----
 
+    def _dispatch_update(self):
+        """Run on the Tk thread: consume the latest coalesced payload."""
+        with self._update_lock:
+            payload = self._latest_payload
+            self._latest_payload = None
+            self._update_pending = False
+        if payload is not None:
+            self._update_ui(*payload)
+
     def _update_ui(self, states: list[dict], events: list[dict]):
         self._update_table(states)
-        for ev in events:
-            self._log_event(ev)
+        if events:
+            self._log_events(events)
 
         rl = self.client.rate_limit_remaining if self.client else "?"
-        now = datetime.datetime.now().strftime("%H:%M:%S")
-        airport = self.airport_var.get().strip().upper()
+        # Skip the datetime object + strftime locale machinery; formatting
+        # struct_time fields directly is enough for a wall-clock stamp
+        lt = time.localtime()
+        now = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
         self._set_status(
-            f"{airport_name(airport)} | Last poll: {now} | "
+            f"{self._monitored_airport_name} | Last poll: {now} | "
             f"Aircraft: {len(states)} | Rate limit remaining: {rl} | "
             f"Events recorded: {len(self.store)}"
         )
 
     def _update_table(self, states: list[dict]):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Diff against the previous poll instead of delete-all + reinsert:
+        # most aircraft persist between polls, so only changed rows cost a
+        # Tcl round trip
+        seen: set[str] = set()
+
+        # Resolve the monitor's filter dispatch once per poll; None means
+        # all traffic matches and the per-row call is skipped entirely.
+        # The matchers themselves test membership against a frozenset.
+        matcher = self.monitor.get_matcher()
+        # Hoist the per-row lookups out of the loop
+        tree = self.tree
+        row_iid = self._row_iid
+        row_iid_get = row_iid.get
+        row_values = self._row_values
+        add_seen = seen.add
 
         for s in states:
-            if not self.monitor._matches_filter(s):
+            if matcher is not None and not matcher(s):
                 continue
 
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    s.get("icao24", ""),
-                    (s.get("callsign") or "").strip(),
-                    _fmt(s.get("baro_altitude")),
-                    _fmt(s.get("velocity")),
-                    _fmt(s.get("true_track")),
-                    _fmt(s.get("vertical_rate")),
-                    "Y" if s.get("on_ground") else "N",
-                    s.get("category", ""),
-                    s.get("origin_country", ""),
-                ),
-            )
-
-    def _log_event(self, ev: dict):
-        etype = ev["type"]
-        tag = etype.upper()
+            # The display row was preformatted on the poll worker thread
+            values = s["_row"]
+            icao = values[0]
+            add_seen(icao)
+
+            iid = row_iid_get(icao)
+            if iid is None:
+                row_iid[icao] = tree.insert("", tk.END, values=values)
+                row_values[icao] = values
+            elif row_values[icao] != values:
+                tree.item(iid, values=values)
+                row_values[icao] = values
+
+        # Drop rows for aircraft that left the bounding box
+        if len(row_iid) != len(seen):
+            for icao in set(row_iid) - seen:
+                tree.delete(row_iid.pop(icao))
+                del row_values[icao]
+
+    def _log_events(self, events: list[dict]):
+        """Append a batch of events with one insert and one scroll.
+
+        Per-event inserts each cross into Tcl; a busy poll multiplies
+        that by the batch size. Build the whole batch as one string,
+        insert it once, then tag the ICAO24 spans by absolute line.char
+        positions computed from the insertion point.
+        """
+        log_text = self.log_text
+        log_text.config(state=tk.NORMAL)
+        # The widget's content always ends with a newline we wrote, so the
+        # batch starts at the line holding the implicit trailing newline
+        line_no = int(log_text.index("end-1c").split(".")[0])
+
+        lines: list[str] = []
+        spans: list[tuple[int, int, int]] = []
+        for ev in events:
+            parts = ev.get("_log_parts")
+            if parts is None:
+                parts = self._format_event_parts(ev)
+            prefix, icao, suffix = parts
+            lines.append(f"{prefix}{icao}{suffix}\n")
+            if _is_icao24(icao):
+                start = len(prefix)
+                spans.append((line_no, start, start + len(icao)))
+            line_no += 1
+
+        log_text.insert(tk.END, "".join(lines))
+        tag_add = log_text.tag_add
+        for ln, c0, c1 in spans:
+            tag_add("icao24_link", f"{ln}.{c0}", f"{ln}.{c1}")
+        self._log_lines += len(lines)
+        self._trim_log()
+        log_text.see(tk.END)
+        log_text.config(state=tk.DISABLED)
+
+    def _format_event_parts(self, ev: dict) -> tuple[str, str, str]:
+        """Build (prefix, icao, suffix) for an event's log line.
+
+        Pure string work with no Tk calls, so the poll worker precomputes
+        it before the batch is marshalled to the UI thread.
+        """
+        tag = ev["type"].upper()
         cs = ev.get("callsign") or "?"
         icao = ev.get("icao24") or "?"
         alt = _fmt(ev.get("altitude_m"))
@@ -582,38 +856,38 @@ class GlycolApp:
         ts = ev.get("timestamp", "")[:19]
         airport = ev.get("airport", "")
 
-        # Look up type code
-        type_code = ICAO24_TO_TYPE.get(icao.lower(), "?")
+        # Look up type code (memoized: skips the lower() copy and dict
+        # probe for repeat offenders)
+        type_code = self._type_cache.get(icao)
+        if type_code is None:
+            type_code = aircraft.ICAO24_TO_TYPE.get(icao.lower(), "?")
+            self._type_cache[icao] = type_code
 
-        # Build message with clickable ICAO24
         airport_str = f"  [{airport}]" if airport else ""
         prefix = f"[{tag}] {ts}{airport_str}  {cs} ("
         suffix = f")  {type_code}  alt={alt}m  spd={spd}m/s"
-
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, prefix)
-
-        # Insert ICAO24 with clickable tags if valid
-        if _ICAO24_RE.match(icao):
-            start_idx = self.log_text.index(tk.END + "-1c")
-            self.log_text.insert(tk.END, icao)
-            end_idx = self.log_text.index(tk.END + "-1c")
-            # Apply both the general link style and a unique tag with the ICAO24
-            self.log_text.tag_add("icao24_link", start_idx, end_idx)
-            self.log_text.tag_add(f"icao24_{icao}", start_idx, end_idx)
-        else:
-            self.log_text.insert(tk.END, icao)
-
-        self.log_text.insert(tk.END, suffix + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        return prefix, icao, suffix
 
     def _log(self, text: str):
         self.log_text.config(state=tk.NORMAL)
         self.log_text.insert(tk.END, text + "\n")
+        self._log_lines += 1
+        self._trim_log()
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
+    def _trim_log(self):
+        """Drop the oldest log lines past MAX_LOG_LINES.
+
+        Must be called while the Text widget is editable. Deleting from
+        "1.0" shifts the surviving lines and their tags up in one Tcl
+        call, keeping per-insert cost flat over long sessions.
+        """
+        if self._log_lines > self.MAX_LOG_LINES:
+            drop = self._log_lines - self.MAX_LOG_LINES
+            self.log_text.delete("1.0", f"{drop + 1}.0")
+            self._log_lines = self.MAX_LOG_LINES
+
     def _set_status(self, text: str):
         self.status_var.set(text)
 
@@ -628,13 +902,20 @@ class GlycolApp:
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
         )
         if path:
-            self.store.save_csv(path)
-            self._log(f"Saved CSV to {path}")
+            # Same policy as Stop: write on a worker thread and marshal
+            # only the confirmation back, so large stores don't freeze Tk
+            store = self.store
+
+            def _save():
+                store.save_csv(path)
+                self.root.after(0, self._log, f"Saved CSV to {path}")
+
+            threading.Thread(target=_save, daemon=True).start()
 
     # ---- Cleanup ----
 
     def _on_close(self):
-        self._stop_polling()
+        self._stop_polling(async_save=False)
         self.root.destroy()
 
 
@@ -1,26 +1,89 @@
+import csv
+import io
 import json
 import logging
 import os
-import queue
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Generator
 
 from flask import Flask, render_template, request, jsonify, Response
 
+try:
+    import orjson
+
+    def _encode_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _encode_json(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover - flask-compress is optional
+    Compress = None
+
+
 from glycol.auth import OpenSkyAuth, load_credentials_from_file
 from glycol.api import OpenSkyClient
 from glycol.aircraft import REG_TO_ICAO24, ICAO24_TO_TYPE
 from glycol.airports import get_bounding_box, airport_name, AIRPORTS
 from glycol.monitor import AircraftMonitor
-from glycol.events import EventStore
+from glycol.events import EventStore, _COLUMNS as _EVENT_COLUMNS
 from glycol.groups import GroupsDatabase
 
+# Package directory, resolved once at import
+_PKG_DIR = Path(__file__).resolve().parent
+
+# Environment-derived defaults, parsed once at import instead of per
+# server construction (same handling as HOST/PORT in web_server.py)
+_POLL_INTERVAL_DEFAULT = int(os.getenv("POLL_INTERVAL", "10"))
+_RADIUS_NM_DEFAULT = float(os.getenv("RADIUS_NM", "5"))
+_CEILING_FT_DEFAULT = float(os.getenv("CEILING_FT", "1500"))
+
+# Unit conversions, as multipliers: one constant load + multiply per row
+# instead of a division against an inline literal
+_M_TO_FT = 1.0 / 0.3048
+_MS_TO_KT = 1.94384
+
+# Seconds of SSE silence before a comment keepalive is sent, so proxies
+# don't reap an idle stream
+_SSE_KEEPALIVE_S = 30.0
+
+
+class _Subscriber:
+    """Per-SSE-client frame buffer.
+
+    deque.append/popleft are single C-level operations (thread-safe under
+    the GIL) and the Event wakes the client thread without the
+    Lock+Condition round trip queue.Queue pays on every put/get. The
+    maxlen evicts the oldest frame when a client falls behind; the
+    broadcaster notices the eviction and schedules a full snapshot so
+    diff-based clients resynchronize.
+    """
+
+    __slots__ = ("frames", "ready")
+
+    MAX_FRAMES = 50
+
+    def __init__(self):
+        self.frames: deque = deque(maxlen=self.MAX_FRAMES)
+        self.ready = threading.Event()
+
 
 class GlycolWebApp:
     """Web-based Glycol airport monitor using Flask and SSE."""
 
+    # Quiet polls before the interval starts stretching, and the cap on
+    # the stretch (interval never exceeds poll_interval * max factor)
+    IDLE_POLLS_BEFORE_BACKOFF = 3
+    MAX_BACKOFF_FACTOR = 8
+
     def __init__(
         self,
         data_dir: str | None = None,
@@ -30,15 +93,27 @@ class GlycolWebApp:
         ceiling_ft: float | None = None,
     ):
         self.app = Flask(__name__,
-                        template_folder=str(Path(__file__).parent / "templates"),
-                        static_folder=str(Path(__file__).parent / "static"))
+                        template_folder=str(_PKG_DIR / "templates"),
+                        static_folder=str(_PKG_DIR / "static"))
+        if Compress is not None:
+            # gzip/br the JSON and CSV responses; both compress well.
+            # The default mimetype list covers JSON but not text/csv, so
+            # without this the export endpoint goes out uncompressed.
+            self.app.config["COMPRESS_MIMETYPES"] = [
+                "text/html",
+                "text/css",
+                "text/csv",
+                "application/json",
+                "application/javascript",
+            ]
+            Compress(self.app)
         self.data_dir = data_dir
         self.logs_dir = logs_dir
 
         # Configuration from environment or parameters
-        self.poll_interval = poll_interval or int(os.getenv("POLL_INTERVAL", "10"))
-        self.radius_nm = radius_nm or float(os.getenv("RADIUS_NM", "5"))
-        self.ceiling_ft = ceiling_ft or float(os.getenv("CEILING_FT", "1500"))
+        self.poll_interval = poll_interval or _POLL_INTERVAL_DEFAULT
+        self.radius_nm = radius_nm or _RADIUS_NM_DEFAULT
+        self.ceiling_ft = ceiling_ft or _CEILING_FT_DEFAULT
 
         # State
         self.auth: OpenSkyAuth | None = None
@@ -51,15 +126,34 @@ class GlycolWebApp:
         )
         self.store = EventStore(logs_dir=logs_dir)
 
+        # AIRPORTS is immutable at runtime; sort once instead of on
+        # every index page load
+        self._sorted_airport_codes = tuple(sorted(AIRPORTS))
+
         # Polling state
         self._polling = False
         self._poll_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self.current_airport = ""
-
-        # SSE state - queues for broadcasting updates
-        self._event_queues: list[queue.Queue] = []
-        self._queues_lock = threading.Lock()
+        # Adaptive polling: consecutive quiet polls stretch the interval
+        # (capped), activity snaps it back to poll_interval
+        self._idle_polls = 0
+        self._backoff_factor = 1
+        # airport -> bounding box; radius_nm is fixed for the life of the
+        # app, so entries stay valid across airport switches
+        self._bbox_cache: dict[str, tuple] = {}
+        # Last broadcast aircraft rows keyed by icao24, for the SSE diff;
+        # the flag forces the next broadcast to carry a full snapshot
+        # (set whenever a client connects mid-session)
+        self._last_aircraft_by_icao: dict[str, dict] = {}
+        self._sse_needs_full = True
+
+        # SSE state - per-client subscribers. The tuple is copy-on-write:
+        # subscribe/unsubscribe build a new tuple under the lock and swap
+        # it atomically, so the per-poll broadcast can iterate a plain
+        # snapshot without taking the lock at all.
+        self._subscribers: tuple[_Subscriber, ...] = ()
+        self._subscribers_lock = threading.Lock()
 
         # Try to authenticate
         self._authenticate()
@@ -91,18 +185,39 @@ class GlycolWebApp:
             "data": data,
             "timestamp": time.time()
         }
-
-        with self._queues_lock:
-            dead_queues = []
-            for q in self._event_queues:
-                try:
-                    q.put_nowait(message)
-                except queue.Full:
-                    dead_queues.append(q)
-
-            # Remove dead queues
-            for q in dead_queues:
-                self._event_queues.remove(q)
+        # Serialize and frame once here; with N clients connected the
+        # per-client generators then just yield the shared string instead
+        # of re-encoding the same message N times
+        frame = f"data: {_encode_json(message)}\n\n"
+
+        # Lock-free hot path: iterate the current snapshot; a concurrent
+        # subscribe/unsubscribe swaps in a new tuple without disturbing it
+        resync = False
+        for sub in self._subscribers:
+            frames = sub.frames
+            if len(frames) == frames.maxlen:
+                # The append below evicts this client's oldest frame; a
+                # diff stream is no longer coherent, so flag a resync
+                resync = True
+            frames.append(frame)
+            sub.ready.set()
+
+        if resync:
+            self._sse_needs_full = True
+
+    def _add_subscriber(self, sub: _Subscriber):
+        """Register an SSE client (copy-on-write swap)."""
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + (sub,)
+        # The newcomer has no baseline to apply diffs against
+        self._sse_needs_full = True
+
+    def _remove_subscriber(self, sub: _Subscriber):
+        """Unregister an SSE client (copy-on-write swap)."""
+        with self._subscribers_lock:
+            self._subscribers = tuple(
+                s for s in self._subscribers if s is not sub
+            )
 
     def _poll_loop(self):
         """Background polling loop."""
@@ -111,48 +226,76 @@ class GlycolWebApp:
         while not self._stop_event.is_set():
             try:
                 if not self.client or not self.current_airport:
-                    time.sleep(1)
+                    self._stop_event.wait(1)
                     continue
 
-                # Get bounding box for airport
-                bbox = get_bounding_box(self.current_airport, radius_nm=self.radius_nm)
-                if not bbox:
-                    logging.warning(f"Airport {self.current_airport} not found")
-                    time.sleep(self.poll_interval)
-                    continue
+                # Get bounding box for airport (computed once per airport)
+                airport = self.current_airport
+                bbox = self._bbox_cache.get(airport)
+                if bbox is None:
+                    bbox = get_bounding_box(airport, radius_nm=self.radius_nm)
+                    if not bbox:
+                        logging.warning(f"Airport {airport} not found")
+                        self._stop_event.wait(self.poll_interval)
+                        continue
+                    self._bbox_cache[airport] = bbox
 
                 # Query API
                 states = self.client.get_states(bbox)
 
                 # Process states for events
-                events = self.monitor.process_states(states, airport=self.current_airport)
+                events = self.monitor.process_states(states, airport=airport)
 
                 # Record events
                 for event in events:
                     self.store.record_event(event)
 
-                # Build aircraft list for display
+                # Build aircraft list for display. Bind the loop-invariant
+                # lookups and the per-row getter once so each row costs a
+                # handful of fast local ops.
                 aircraft_list = []
+                append = aircraft_list.append
                 for state in states:
-                    icao24 = state.get("icao24", "")
-                    callsign = state.get("callsign", "")
-                    on_ground = state.get("on_ground", False)
-                    altitude = state.get("baro_altitude")
-                    velocity = state.get("velocity")
-
-                    aircraft_list.append({
-                        "icao24": icao24,
-                        "callsign": callsign,
-                        "on_ground": on_ground,
-                        "altitude": round(altitude / 0.3048) if altitude else None,
-                        "velocity": round(velocity * 1.94384) if velocity else None,
+                    get = state.get
+                    altitude = get("baro_altitude")
+                    velocity = get("velocity")
+
+                    append({
+                        "icao24": get("icao24", ""),
+                        "callsign": get("callsign", ""),
+                        "on_ground": get("on_ground", False),
+                        # "is not None": an altitude/velocity of exactly 0
+                        # (aircraft on the ground) is a real reading, not
+                        # a missing one
+                        "altitude": round(altitude * _M_TO_FT) if altitude is not None else None,
+                        "velocity": round(velocity * _MS_TO_KT) if velocity is not None else None,
                     })
 
-                # Broadcast updates
-                self._broadcast_event("aircraft_update", {
-                    "aircraft": aircraft_list,
-                    "count": len(aircraft_list)
-                })
+                # Broadcast a diff against the previous poll: most rows
+                # repeat poll to poll, so steady-state payloads shrink to
+                # the handful of changed aircraft. A full snapshot goes
+                # out when a client (re)connects with no baseline.
+                last = self._last_aircraft_by_icao
+                current = {a["icao24"]: a for a in aircraft_list}
+                if self._sse_needs_full or not last:
+                    self._sse_needs_full = False
+                    self._broadcast_event("aircraft_update", {
+                        "full": True,
+                        "aircraft": aircraft_list,
+                        "count": len(aircraft_list)
+                    })
+                else:
+                    last_get = last.get
+                    self._broadcast_event("aircraft_update", {
+                        "full": False,
+                        "upsert": [
+                            a for a in aircraft_list
+                            if last_get(a["icao24"]) != a
+                        ],
+                        "removed": [i for i in last if i not in current],
+                        "count": len(aircraft_list)
+                    })
+                self._last_aircraft_by_icao = current
 
                 if events:
                     self._broadcast_event("new_events", {
@@ -165,18 +308,35 @@ class GlycolWebApp:
                         "remaining": self.client.rate_limit_remaining
                     })
 
-                time.sleep(self.poll_interval)
+                # Adaptive backoff: an empty bbox (including the client's
+                # own 429 backoff window, where get_states returns [])
+                # stretches the interval after a few quiet polls; any
+                # activity snaps it back to the base rate
+                if states:
+                    self._idle_polls = 0
+                    self._backoff_factor = 1
+                else:
+                    self._idle_polls += 1
+                    if (
+                        self._idle_polls >= self.IDLE_POLLS_BEFORE_BACKOFF
+                        and self._backoff_factor < self.MAX_BACKOFF_FACTOR
+                    ):
+                        self._backoff_factor *= 2
+
+                # Event.wait instead of sleep so /api/stop interrupts the
+                # (possibly stretched) pause immediately
+                self._stop_event.wait(self.poll_interval * self._backoff_factor)
 
             except Exception as e:
                 logging.error(f"Poll error: {e}", exc_info=True)
-                time.sleep(5)
+                self._stop_event.wait(5)
 
         logging.info("Poll loop stopped")
 
     def _format_event(self, event: dict) -> dict:
         """Format event for JSON serialization."""
         altitude_m = event.get("altitude_m")
-        altitude_ft = round(altitude_m / 0.3048) if altitude_m is not None else None
+        altitude_ft = round(altitude_m * _M_TO_FT) if altitude_m is not None else None
 
         return {
             "timestamp": event.get("timestamp", ""),
@@ -192,8 +352,7 @@ class GlycolWebApp:
 
         @self.app.route("/")
         def index():
-            airport_codes = sorted(AIRPORTS.keys())
-            return render_template("index.html", airports=airport_codes)
+            return render_template("index.html", airports=self._sorted_airport_codes)
 
         @self.app.route("/api/start", methods=["POST"])
         def start_monitoring():
@@ -218,6 +377,9 @@ class GlycolWebApp:
 
             # Start polling
             self.current_airport = airport
+            # A fresh session polls at the base rate again
+            self._idle_polls = 0
+            self._backoff_factor = 1
 
             if not self._polling:
                 self._stop_event.clear()
@@ -245,24 +407,47 @@ class GlycolWebApp:
 
         @self.app.route("/api/events")
         def get_events():
-            df = self.store.get_dataframe()
+            # Walk the store's row dicts directly: the DataFrame detour
+            # plus iterrows boxed every row into a Series just to read
+            # five fields back out of it
             events = []
-            for _, row in df.iterrows():
+            for ev in self.store.iter_events():
+                alt = ev.get("altitude_m")
                 events.append({
-                    "timestamp": row["timestamp"].isoformat() if hasattr(row["timestamp"], "isoformat") else str(row["timestamp"]),
-                    "icao24": row["icao24"],
-                    "callsign": row.get("callsign", ""),
-                    "event_type": row["event_type"],
-                    "altitude_ft": row.get("altitude_m") * 3.28084 if row.get("altitude_m") else None,
+                    # record_event stores timestamps as ISO strings
+                    "timestamp": ev["timestamp"],
+                    "icao24": ev["icao24"],
+                    "callsign": ev.get("callsign", ""),
+                    "event_type": ev["event_type"],
+                    "altitude_ft": alt * _M_TO_FT if alt is not None else None,
                 })
-            return jsonify({"events": events})
+            # Bypass jsonify: orjson (when present) encodes the whole
+            # list in C and this payload can be large
+            return Response(
+                _encode_json({"events": events}), mimetype="application/json"
+            )
 
         @self.app.route("/api/export_csv")
         def export_csv():
-            df = self.store.get_dataframe()
-            csv_data = df.to_csv(index=False)
+            # Stream the CSV in chunks straight from the event rows: no
+            # DataFrame, and peak memory stays at one chunk instead of
+            # the whole export
+            events = self.store.iter_events()
+
+            def generate():
+                buf = io.StringIO()
+                writer = csv.DictWriter(buf, fieldnames=_EVENT_COLUMNS)
+                writer.writeheader()
+                for i, ev in enumerate(events, 1):
+                    writer.writerow(ev)
+                    if i % 1024 == 0:
+                        yield buf.getvalue()
+                        buf.seek(0)
+                        buf.truncate()
+                yield buf.getvalue()
+
             return Response(
-                csv_data,
+                generate(),
                 mimetype="text/csv",
                 headers={"Content-Disposition": "attachment;filename=glycol_events.csv"}
             )
@@ -309,25 +494,38 @@ class GlycolWebApp:
         def stream():
             """Server-Sent Events endpoint for real-time updates."""
             def event_stream() -> Generator[str, None, None]:
-                q: queue.Queue = queue.Queue(maxsize=50)
-
-                with self._queues_lock:
-                    self._event_queues.append(q)
+                sub = _Subscriber()
+                self._add_subscriber(sub)
 
                 try:
+                    last_emit = time.monotonic()
                     while True:
-                        try:
-                            message = q.get(timeout=30)
-                            yield f"data: {json.dumps(message)}\n\n"
-                        except queue.Empty:
-                            # Send keepalive
+                        # Wake at the keepalive deadline measured from the
+                        # last byte actually sent, not a fresh window per
+                        # wait - the stream stays strictly quieter than
+                        # one emission per _SSE_KEEPALIVE_S
+                        timeout = _SSE_KEEPALIVE_S - (time.monotonic() - last_emit)
+                        if timeout <= 0 or not sub.ready.wait(timeout=timeout):
                             yield ": keepalive\n\n"
+                            last_emit = time.monotonic()
+                            continue
+                        # Clear before draining: a frame appended after
+                        # the clear is caught by the drain, one appended
+                        # after the drain re-sets the event
+                        sub.ready.clear()
+                        while True:
+                            try:
+                                frame = sub.frames.popleft()
+                            except IndexError:
+                                break
+                            # Frames arrive pre-serialized from
+                            # _broadcast_event; just hand them on
+                            yield frame
+                        last_emit = time.monotonic()
                 except GeneratorExit:
                     pass
                 finally:
-                    with self._queues_lock:
-                        if q in self._event_queues:
-                            self._event_queues.remove(q)
+                    self._remove_subscriber(sub)
 
             return Response(
                 event_stream(),
@@ -6,21 +6,138 @@ Supports managing both planes of interest (POI) and aircraft type groups/glossar
 through either command-line arguments or an interactive menu-driven interface.
 """
 
+from __future__ import annotations
+
 import argparse
+import json
 import sys
+from itertools import starmap
+from operator import attrgetter
 from pathlib import Path
 
 # Add glycol to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from glycol.poi import POIDatabase, PlaneOfInterest
-from glycol.typegroups import TypeGroupsDatabase, AircraftType
+
+def _load_databases():
+    """Import the database modules on first use.
+
+    glycol.poi and glycol.typegroups (plus their optional orjson import)
+    are only needed once a command actually runs; --help output and
+    argparse errors skip the cost entirely. Idempotent - repeat calls
+    are plain dict lookups.
+    """
+    global POIDatabase, PlaneOfInterest, TypeGroupsDatabase, AircraftType
+    from glycol.poi import POIDatabase, PlaneOfInterest
+    from glycol.typegroups import TypeGroupsDatabase, AircraftType
+
+# Shared table layout for glossary-style listings (glossary list/search and
+# group views all render the same columns). The bound .format reference is
+# built once instead of re-writing the column spec at every call site, and
+# rows are joined into a single write per table rather than printed one by
+# one.
+_GLOSSARY_HEADER = f"{'Code':<8} {'Make':<20} {'Model':<30} {'Notes':<40}\n" + "-" * 98
+_GLOSSARY_ROW = "{:<8} {:<20} {:<30} {:<40}".format
+
+_POI_HEADER = (
+    f"{'Name':<20} {'ICAO24':<10} {'Tail Number':<12} {'Make/Model':<25} {'Notes':<30}\n"
+    + "-" * 107
+)
+# Width.precision on all but the last column: over-wide fields are
+# truncated instead of pushing the rest of the row out of alignment
+_POI_ROW = "{:<20.20} {:<10.10} {:<12.12} {:<25.25} {:<30}".format
+
+# C-implemented sort key for AircraftType listings; avoids a Python frame
+# per key extraction compared to a lambda.
+_AIRCRAFT_CODE_KEY = attrgetter("code")
+
+# Column extractors for the table renderers, paired with the bound row
+# formats above: map(fields) + starmap(row) runs the whole render loop in
+# C, with no per-row Python bytecode between the object and its line.
+_POI_FIELDS = attrgetter("name", "icao24", "tailnumber", "make_model", "notes")
+_GLOSSARY_FIELDS = attrgetter("code", "make", "model", "notes")
+
+
+# Flush threshold for table output: large enough that even big tables need
+# only a handful of writes, small enough to bound peak buffering.
+_CHUNK = 64 * 1024
+
+
+def _write_chunked(rows):
+    """Write newline-separated rows to stdout in ~64 KiB batches.
+
+    Joining a whole table first holds every row plus the joined buffer in
+    memory at once; flushing in chunks bounds the peak while still
+    issuing few writes. Accepts any iterable, so callers can pass a
+    generator and never materialize the row list.
+    """
+    write = sys.stdout.write
+    buf = []
+    size = 0
+    for row in rows:
+        buf.append(row)
+        size += len(row) + 1
+        if size >= _CHUNK:
+            write("\n".join(buf) + "\n")
+            buf.clear()
+            size = 0
+    if buf:
+        write("\n".join(buf) + "\n")
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _looks_like_icao24(s: str) -> bool:
+    """True when *s* has the shape of an ICAO24 address: exactly 6 hex chars."""
+    return len(s) == 6 and all(c in _HEX_DIGITS for c in s)
+
+
+def _prompt(msg: str) -> str:
+    """input() replacement that skips readline setup when stdin is not a TTY.
+
+    The first input() call initializes the readline machinery, which
+    scripted (piped) sessions never benefit from. Off-TTY this reads a
+    plain line from sys.stdin after writing the prompt explicitly; EOF
+    raises EOFError to match input() semantics.
+    """
+    if sys.stdin.isatty():
+        return input(msg)
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def _prompt_code(msg: str) -> str:
+    """Prompt for an aircraft type code, normalized to stripped uppercase.
+
+    Codes typed in uppercase already (the common case when copying from
+    a listing) skip the re-allocating upper() call, same as AircraftType
+    does on construction.
+    """
+    code = _prompt(msg).strip()
+    return code if code.isupper() else code.upper()
 
 
 # =============================================================================
 # POI Management Functions
 # =============================================================================
 
+def _find_plane(db: POIDatabase, identifier: str):
+    """Resolve a tail number or ICAO24 to a plane, probing the likely index first.
+
+    Tail numbers are rarely 6 hex characters, so the shape check skips a
+    wasted icao24 probe in the common tail-number case. Both indexes are
+    still consulted before giving up.
+    """
+    if _looks_like_icao24(identifier):
+        return db.get_by_icao24(identifier) or db.get_by_tailnumber(identifier)
+    return db.get_by_tailnumber(identifier) or db.get_by_icao24(identifier)
+
+
 def poi_list(db: POIDatabase):
     """List all planes in the database."""
     planes = db.list_all()
@@ -28,28 +145,23 @@ def poi_list(db: POIDatabase):
         print("\nNo planes in database")
         return
 
-    print(f"\n{'Name':<20} {'ICAO24':<10} {'Tail Number':<12} {'Make/Model':<25} {'Notes':<30}")
-    print("-" * 107)
-    for plane in planes:
-        print(
-            f"{plane.name:<20} {plane.icao24:<10} {plane.tailnumber:<12} "
-            f"{plane.make_model:<25} {plane.notes:<30}"
-        )
+    print("\n" + _POI_HEADER)
+    _write_chunked(starmap(_POI_ROW, map(_POI_FIELDS, planes)))
     print(f"\nTotal: {len(planes)} planes")
 
 
 def poi_add_interactive(db: POIDatabase):
     """Interactively add a plane."""
     print("\n=== Add Plane ===")
-    tail = input("Tail number (required): ").strip()
+    tail = _prompt("Tail number (required): ").strip()
     if not tail:
         print("Error: Tail number is required")
         return
 
-    name = input("Name (optional): ").strip()
-    icao24 = input("ICAO24 address (optional): ").strip()
-    model = input("Make/Model (optional): ").strip()
-    notes = input("Notes (optional): ").strip()
+    name = _prompt("Name (optional): ").strip()
+    icao24 = _prompt("ICAO24 address (optional): ").strip()
+    model = _prompt("Make/Model (optional): ").strip()
+    notes = _prompt("Notes (optional): ").strip()
 
     plane = PlaneOfInterest(
         tailnumber=tail,
@@ -68,12 +180,9 @@ def poi_add_interactive(db: POIDatabase):
 def poi_get_interactive(db: POIDatabase):
     """Interactively get a plane's details."""
     print("\n=== Get Plane Details ===")
-    identifier = input("Enter tail number or ICAO24: ").strip()
-
-    plane = db.get_by_icao24(identifier)
-    if not plane:
-        plane = db.get_by_tailnumber(identifier)
+    identifier = _prompt("Enter tail number or ICAO24: ").strip()
 
+    plane = _find_plane(db, identifier)
     if not plane:
         print(f"\n✗ Plane not found: {identifier}")
         return
@@ -88,7 +197,7 @@ def poi_get_interactive(db: POIDatabase):
 def poi_update_interactive(db: POIDatabase):
     """Interactively update a plane."""
     print("\n=== Update Plane ===")
-    tail = input("Tail number: ").strip()
+    tail = _prompt("Tail number: ").strip()
 
     plane = db.get_by_tailnumber(tail)
     if not plane:
@@ -102,43 +211,58 @@ def poi_update_interactive(db: POIDatabase):
     print(f"  Notes:      {plane.notes}")
 
     print("\nEnter new values (press Enter to keep current):")
-    name = input(f"Name [{plane.name}]: ").strip()
-    icao24 = input(f"ICAO24 [{plane.icao24}]: ").strip()
-    model = input(f"Make/Model [{plane.make_model}]: ").strip()
-    notes = input(f"Notes [{plane.notes}]: ").strip()
+    name = _prompt(f"Name [{plane.name}]: ").strip()
+    icao24 = _prompt(f"ICAO24 [{plane.icao24}]: ").strip()
+    model = _prompt(f"Make/Model [{plane.make_model}]: ").strip()
+    notes = _prompt(f"Notes [{plane.notes}]: ").strip()
 
+    updates = {}
     if name:
-        plane.name = name
+        updates["name"] = name
     if icao24:
-        plane.icao24 = icao24
+        updates["icao24"] = icao24
     if model:
-        plane.make_model = model
+        updates["make_model"] = model
     if notes:
-        plane.notes = notes
+        updates["notes"] = notes
 
-    db.save()
-    print(f"\n✓ Updated plane: {tail}")
+    if updates:
+        db.update_by_tailnumber(tail, **updates)
+        print(f"\n✓ Updated plane: {tail}")
+    else:
+        print("\nNo changes made")
 
 
 def poi_remove_interactive(db: POIDatabase):
     """Interactively remove a plane."""
     print("\n=== Remove Plane ===")
-    tail = input("Tail number: ").strip()
+    tail = _prompt("Tail number: ").strip()
 
     plane = db.get_by_tailnumber(tail)
     if not plane:
         print(f"\n✗ Plane not found: {tail}")
         return
 
-    confirm = input(f"Remove {plane.name or tail}? (yes/no): ").strip().lower()
+    confirm = _prompt(f"Remove {plane.name or tail}? (yes/no): ").strip().lower()
     if confirm == "yes":
-        db.planes.remove(plane)
-        db.save()
+        db.remove_by_tailnumber(tail)
         print(f"\n✓ Removed plane: {tail}")
     else:
         print("\nCancelled")
 
 
+def poi_switch_category_interactive(db: POIDatabase):
+    """Interactively switch the active POI category."""
+    categories = db.list_categories()
+    print("\nAvailable categories:")
+    for cat in categories:
+        print(f"  - {cat}")
+    new_cat = _prompt("\nEnter category name: ").strip()
+    if new_cat:
+        db.switch_category(new_cat)
+        print(f"\n✓ Switched to category: {new_cat}")
+
+
 def poi_categories(db: POIDatabase):
     """List all POI categories."""
     categories = db.list_categories()
@@ -153,20 +277,104 @@ def poi_categories(db: POIDatabase):
     print()
 
 
+# Fields a batch update may set. The tail number is the operation's key,
+# not an updatable field: forwarding it to setattr would bypass the
+# constructor's normalization and leave the tail index keyed under the
+# old value.
+_POI_BATCH_FIELDS = frozenset(("name", "icao24", "make_model", "notes"))
+
+
+def poi_batch(db: POIDatabase):
+    """Apply JSON Lines operations from stdin and save once.
+
+    Each line is an object like ``{"op": "update", "tail": "N123AB",
+    "notes": "..."}``; supported ops are add, update, and remove, all
+    keyed by tail number. Updates may set name, icao24, make_model, and
+    notes. The stream is applied inside one batch() block, so the
+    database file is rewritten once at the end instead of once per
+    operation.
+    """
+    applied = failed = 0
+    with db.batch():
+        for lineno, line in enumerate(sys.stdin, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                fields = json.loads(line)
+                op = fields.pop("op")
+                tail = fields.pop("tail")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                print(f"Line {lineno}: not a valid operation: {line}")
+                failed += 1
+                continue
+            if op == "add":
+                ok = db.add(PlaneOfInterest(
+                    tailnumber=tail,
+                    name=fields.get("name", ""),
+                    icao24=fields.get("icao24", ""),
+                    make_model=fields.get("make_model", ""),
+                    notes=fields.get("notes", ""),
+                ))
+            elif op == "update":
+                unknown = fields.keys() - _POI_BATCH_FIELDS
+                if unknown:
+                    print(f"Line {lineno}: unknown fields: {', '.join(sorted(unknown))}")
+                    failed += 1
+                    continue
+                ok = db.update_by_tailnumber(tail, **fields)
+            elif op == "remove":
+                ok = db.remove_by_tailnumber(tail)
+            else:
+                print(f"Line {lineno}: unknown op: {op}")
+                failed += 1
+                continue
+            if ok:
+                applied += 1
+            else:
+                print(f"Line {lineno}: {op} failed for {tail}")
+                failed += 1
+    print(f"Applied {applied} operations ({failed} failed)")
+
+
 # =============================================================================
 # Groups Management Functions
 # =============================================================================
 
+def _pick_group(sorted_groups):
+    """Show the group list and read a name-or-number selection.
+
+    Expects the pre-sorted list from db.sorted_groups() and reuses it
+    for both the enumerated display and the numeric-choice resolution
+    (the callers used to sort twice per interaction). Returns the chosen
+    group name, or None after printing a message when a numeric choice
+    is out of range.
+    """
+    print("\nAvailable groups:")
+    for i, group in enumerate(sorted_groups, 1):
+        print(f"  {i}. {group}")
+
+    choice = _prompt("\nEnter group name or number: ").strip()
+
+    if choice.isdigit():
+        idx = int(choice) - 1
+        if 0 <= idx < len(sorted_groups):
+            return sorted_groups[idx]
+        print("Invalid selection")
+        return None
+    return choice
+
+
 def groups_list(db: TypeGroupsDatabase):
     """List all groups."""
-    groups = db.list_groups()
+    groups = db.sorted_groups()
     if not groups:
         print("\nNo groups in database")
         return
 
     print("\nAircraft Groups:")
     print("-" * 60)
-    for group in sorted(groups):
+    for group in groups:
         codes = db.get_group(group)
         print(f"{group:<20} ({len(codes)} aircraft)")
     print(f"\nTotal: {len(groups)} groups")
@@ -175,28 +383,14 @@ def groups_list(db: TypeGroupsDatabase):
 def groups_view_interactive(db: TypeGroupsDatabase):
     """View aircraft in a group."""
     print("\n=== View Group ===")
-    groups = db.list_groups()
+    groups = db.sorted_groups()
     if not groups:
         print("No groups available")
         return
 
-    print("\nAvailable groups:")
-    for i, group in enumerate(sorted(groups), 1):
-        print(f"  {i}. {group}")
-
-    choice = input("\nEnter group name or number: ").strip()
-
-    # Handle numeric choice
-    if choice.isdigit():
-        idx = int(choice) - 1
-        sorted_groups = sorted(groups)
-        if 0 <= idx < len(sorted_groups):
-            group_name = sorted_groups[idx]
-        else:
-            print("Invalid selection")
-            return
-    else:
-        group_name = choice
+    group_name = _pick_group(groups)
+    if group_name is None:
+        return
 
     codes = db.get_group(group_name)
     if codes is None:
@@ -204,15 +398,20 @@ def groups_view_interactive(db: TypeGroupsDatabase):
         return
 
     print(f"\n=== {group_name} ===")
-    print(f"{'Code':<8} {'Make':<20} {'Model':<30} {'Notes':<40}")
-    print("-" * 98)
+    print(_GLOSSARY_HEADER)
 
-    for code in sorted(codes):
-        aircraft = db.get_aircraft_type(code)
-        if aircraft:
-            print(f"{code:<8} {aircraft.make:<20} {aircraft.model:<30} {aircraft.notes:<40}")
-        else:
-            print(f"{code:<8} (not in glossary)")
+    # get_group returns the codes pre-sorted; no re-sort needed here
+    types_map = db.get_aircraft_types_bulk(codes)
+
+    def rows():
+        for code in codes:
+            aircraft = types_map[code]
+            if aircraft:
+                yield _GLOSSARY_ROW(code, aircraft.make, aircraft.model, aircraft.notes)
+            else:
+                yield f"{code:<8} (not in glossary)"
+
+    _write_chunked(rows())
 
     print(f"\nTotal: {len(codes)} aircraft")
 
@@ -220,7 +419,7 @@ def groups_view_interactive(db: TypeGroupsDatabase):
 def groups_create_interactive(db: TypeGroupsDatabase):
     """Interactively create a group."""
     print("\n=== Create Group ===")
-    name = input("Group name: ").strip()
+    name = _prompt("Group name: ").strip()
     if not name:
         print("Error: Group name is required")
         return
@@ -234,34 +433,20 @@ def groups_create_interactive(db: TypeGroupsDatabase):
 def groups_add_aircraft_interactive(db: TypeGroupsDatabase):
     """Add aircraft to a group."""
     print("\n=== Add Aircraft to Group ===")
-    groups = db.list_groups()
+    groups = db.sorted_groups()
     if not groups:
         print("No groups available. Create a group first.")
         return
 
-    print("\nAvailable groups:")
-    for i, group in enumerate(sorted(groups), 1):
-        print(f"  {i}. {group}")
-
-    choice = input("\nEnter group name or number: ").strip()
-
-    # Handle numeric choice
-    if choice.isdigit():
-        idx = int(choice) - 1
-        sorted_groups = sorted(groups)
-        if 0 <= idx < len(sorted_groups):
-            group_name = sorted_groups[idx]
-        else:
-            print("Invalid selection")
-            return
-    else:
-        group_name = choice
+    group_name = _pick_group(groups)
+    if group_name is None:
+        return
 
     if group_name not in groups:
         print(f"\n✗ Group not found: {group_name}")
         return
 
-    code = input("Aircraft type code: ").strip().upper()
+    code = _prompt_code("Aircraft type code: ")
     if not code:
         print("Error: Aircraft code is required")
         return
@@ -275,28 +460,14 @@ def groups_add_aircraft_interactive(db: TypeGroupsDatabase):
 def groups_remove_aircraft_interactive(db: TypeGroupsDatabase):
     """Remove aircraft from a group."""
     print("\n=== Remove Aircraft from Group ===")
-    groups = db.list_groups()
+    groups = db.sorted_groups()
     if not groups:
         print("No groups available")
         return
 
-    print("\nAvailable groups:")
-    for i, group in enumerate(sorted(groups), 1):
-        print(f"  {i}. {group}")
-
-    choice = input("\nEnter group name or number: ").strip()
-
-    # Handle numeric choice
-    if choice.isdigit():
-        idx = int(choice) - 1
-        sorted_groups = sorted(groups)
-        if 0 <= idx < len(sorted_groups):
-            group_name = sorted_groups[idx]
-        else:
-            print("Invalid selection")
-            return
-    else:
-        group_name = choice
+    group_name = _pick_group(groups)
+    if group_name is None:
+        return
 
     codes = db.get_group(group_name)
     if codes is None:
@@ -308,10 +479,10 @@ def groups_remove_aircraft_interactive(db: TypeGroupsDatabase):
         return
 
     print(f"\nAircraft in {group_name}:")
-    for code in sorted(codes):
+    for code in codes:
         print(f"  - {code}")
 
-    code = input("\nAircraft type code to remove: ").strip().upper()
+    code = _prompt_code("\nAircraft type code to remove: ")
     if db.remove_from_group(group_name, code):
         print(f"\n✓ Removed {code} from {group_name}")
     else:
@@ -321,30 +492,16 @@ def groups_remove_aircraft_interactive(db: TypeGroupsDatabase):
 def groups_delete_interactive(db: TypeGroupsDatabase):
     """Delete a group."""
     print("\n=== Delete Group ===")
-    groups = db.list_groups()
+    groups = db.sorted_groups()
     if not groups:
         print("No groups available")
         return
 
-    print("\nAvailable groups:")
-    for i, group in enumerate(sorted(groups), 1):
-        print(f"  {i}. {group}")
-
-    choice = input("\nEnter group name or number: ").strip()
-
-    # Handle numeric choice
-    if choice.isdigit():
-        idx = int(choice) - 1
-        sorted_groups = sorted(groups)
-        if 0 <= idx < len(sorted_groups):
-            group_name = sorted_groups[idx]
-        else:
-            print("Invalid selection")
-            return
-    else:
-        group_name = choice
+    group_name = _pick_group(groups)
+    if group_name is None:
+        return
 
-    confirm = input(f"Delete group '{group_name}'? (yes/no): ").strip().lower()
+    confirm = _prompt(f"Delete group '{group_name}'? (yes/no): ").strip().lower()
     if confirm == "yes":
         if db.delete_group(group_name):
             print(f"\n✓ Deleted group: {group_name}")
@@ -365,17 +522,17 @@ def glossary_list(db: TypeGroupsDatabase):
         print("\nNo aircraft types in glossary")
         return
 
-    print(f"\n{'Code':<8} {'Make':<20} {'Model':<30} {'Notes':<40}")
-    print("-" * 98)
-    for aircraft in sorted(types, key=lambda a: a.code):
-        print(f"{aircraft.code:<8} {aircraft.make:<20} {aircraft.model:<30} {aircraft.notes:<40}")
+    print("\n" + _GLOSSARY_HEADER)
+    _write_chunked(
+        starmap(_GLOSSARY_ROW, map(_GLOSSARY_FIELDS, sorted(types, key=_AIRCRAFT_CODE_KEY)))
+    )
     print(f"\nTotal: {len(types)} aircraft types")
 
 
 def glossary_get_interactive(db: TypeGroupsDatabase):
     """Get details for an aircraft type."""
     print("\n=== Get Aircraft Type ===")
-    code = input("Aircraft type code: ").strip().upper()
+    code = _prompt_code("Aircraft type code: ")
 
     aircraft = db.get_aircraft_type(code)
     if not aircraft:
@@ -391,14 +548,14 @@ def glossary_get_interactive(db: TypeGroupsDatabase):
 def glossary_add_interactive(db: TypeGroupsDatabase):
     """Add an aircraft type to glossary."""
     print("\n=== Add Aircraft Type ===")
-    code = input("Type code (required): ").strip().upper()
+    code = _prompt_code("Type code (required): ")
     if not code:
         print("Error: Type code is required")
         return
 
-    make = input("Make: ").strip()
-    model = input("Model: ").strip()
-    notes = input("Notes: ").strip()
+    make = _prompt("Make: ").strip()
+    model = _prompt("Model: ").strip()
+    notes = _prompt("Notes: ").strip()
 
     aircraft = AircraftType(code=code, make=make, model=model, notes=notes)
 
@@ -411,7 +568,7 @@ def glossary_add_interactive(db: TypeGroupsDatabase):
 def glossary_update_interactive(db: TypeGroupsDatabase):
     """Update an aircraft type."""
     print("\n=== Update Aircraft Type ===")
-    code = input("Type code: ").strip().upper()
+    code = _prompt_code("Type code: ")
 
     aircraft = db.get_aircraft_type(code)
     if not aircraft:
@@ -424,9 +581,9 @@ def glossary_update_interactive(db: TypeGroupsDatabase):
     print(f"  Notes: {aircraft.notes}")
 
     print("\nEnter new values (press Enter to keep current):")
-    make = input(f"Make [{aircraft.make}]: ").strip()
-    model = input(f"Model [{aircraft.model}]: ").strip()
-    notes = input(f"Notes [{aircraft.notes}]: ").strip()
+    make = _prompt(f"Make [{aircraft.make}]: ").strip()
+    model = _prompt(f"Model [{aircraft.model}]: ").strip()
+    notes = _prompt(f"Notes [{aircraft.notes}]: ").strip()
 
     updates = {}
     if make:
@@ -446,14 +603,14 @@ def glossary_update_interactive(db: TypeGroupsDatabase):
 def glossary_remove_interactive(db: TypeGroupsDatabase):
     """Remove an aircraft type from glossary."""
     print("\n=== Remove Aircraft Type ===")
-    code = input("Type code: ").strip().upper()
+    code = _prompt_code("Type code: ")
 
     aircraft = db.get_aircraft_type(code)
     if not aircraft:
         print(f"\n✗ Aircraft type not found: {code}")
         return
 
-    confirm = input(f"Remove {code} ({aircraft.model})? (yes/no): ").strip().lower()
+    confirm = _prompt(f"Remove {code} ({aircraft.model})? (yes/no): ").strip().lower()
     if confirm == "yes":
         db.remove_aircraft_type(code)
         print(f"\n✓ Removed aircraft type: {code}")
@@ -464,17 +621,17 @@ def glossary_remove_interactive(db: TypeGroupsDatabase):
 def glossary_search_interactive(db: TypeGroupsDatabase):
     """Search for aircraft types."""
     print("\n=== Search Aircraft Types ===")
-    query = input("Search query: ").strip()
+    query = _prompt("Search query: ").strip()
 
     results = db.search_types(query)
     if not results:
         print(f"\nNo results found for: {query}")
         return
 
-    print(f"\n{'Code':<8} {'Make':<20} {'Model':<30} {'Notes':<40}")
-    print("-" * 98)
-    for aircraft in sorted(results, key=lambda a: a.code):
-        print(f"{aircraft.code:<8} {aircraft.make:<20} {aircraft.model:<30} {aircraft.notes:<40}")
+    print("\n" + _GLOSSARY_HEADER)
+    _write_chunked(
+        starmap(_GLOSSARY_ROW, map(_GLOSSARY_FIELDS, sorted(results, key=_AIRCRAFT_CODE_KEY)))
+    )
     print(f"\nFound: {len(results)} results")
 
 
@@ -482,11 +639,49 @@ def glossary_search_interactive(db: TypeGroupsDatabase):
 # Interactive Mode
 # =============================================================================
 
+# Menu dispatch tables: one dict lookup per keystroke instead of walking an
+# if/elif ladder of string comparisons. "0" (back/exit) stays in the loops.
+_POI_MENU_ACTIONS = {
+    "1": poi_list,
+    "2": poi_get_interactive,
+    "3": poi_add_interactive,
+    "4": poi_update_interactive,
+    "5": poi_remove_interactive,
+    "6": poi_categories,
+    "7": poi_switch_category_interactive,
+}
+
+_GROUPS_MENU_ACTIONS = {
+    "1": groups_list,
+    "2": groups_view_interactive,
+    "3": groups_create_interactive,
+    "4": groups_add_aircraft_interactive,
+    "5": groups_remove_aircraft_interactive,
+    "6": groups_delete_interactive,
+}
+
+_GLOSSARY_MENU_ACTIONS = {
+    "1": glossary_list,
+    "2": glossary_get_interactive,
+    "3": glossary_search_interactive,
+    "4": glossary_add_interactive,
+    "5": glossary_update_interactive,
+    "6": glossary_remove_interactive,
+}
+
+
 def interactive_mode(data_dir=None):
     """Run in interactive menu mode."""
+    _load_databases()
     poi_db = POIDatabase(data_dir=data_dir)
     groups_db = TypeGroupsDatabase(data_dir=data_dir)
 
+    menus = {
+        "1": (poi_menu, poi_db),
+        "2": (groups_menu, groups_db),
+        "3": (glossary_menu, groups_db),
+    }
+
     while True:
         print("\n" + "=" * 60)
         print("GLYCOL DATABASE MANAGER")
@@ -497,14 +692,12 @@ def interactive_mode(data_dir=None):
         print("  3. Aircraft Glossary")
         print("  0. Exit")
 
-        choice = input("\nSelect option: ").strip()
+        choice = _prompt("\nSelect option: ").strip()
 
-        if choice == "1":
-            poi_menu(poi_db)
-        elif choice == "2":
-            groups_menu(groups_db)
-        elif choice == "3":
-            glossary_menu(groups_db)
+        entry = menus.get(choice)
+        if entry is not None:
+            menu, db = entry
+            menu(db)
         elif choice == "0":
             print("\nGoodbye!")
             break
@@ -513,123 +706,99 @@ def interactive_mode(data_dir=None):
 
 
 def poi_menu(db: POIDatabase):
-    """POI management menu."""
-    while True:
-        print("\n" + "-" * 60)
-        print(f"PLANES OF INTEREST - Category: {db.category}")
-        print("-" * 60)
-        print("\n  1. List all planes")
-        print("  2. Get plane details")
-        print("  3. Add plane")
-        print("  4. Update plane")
-        print("  5. Remove plane")
-        print("  6. List categories")
-        print("  7. Switch category")
-        print("  0. Back to main menu")
-
-        choice = input("\nSelect option: ").strip()
-
-        if choice == "1":
-            poi_list(db)
-        elif choice == "2":
-            poi_get_interactive(db)
-        elif choice == "3":
-            poi_add_interactive(db)
-        elif choice == "4":
-            poi_update_interactive(db)
-        elif choice == "5":
-            poi_remove_interactive(db)
-        elif choice == "6":
-            poi_categories(db)
-        elif choice == "7":
-            categories = db.list_categories()
-            print("\nAvailable categories:")
-            for cat in categories:
-                print(f"  - {cat}")
-            new_cat = input("\nEnter category name: ").strip()
-            if new_cat:
-                db.switch_category(new_cat)
-                print(f"\n✓ Switched to category: {new_cat}")
-        elif choice == "0":
-            break
-        else:
-            print("\nInvalid choice")
+    """POI management menu.
+
+    The whole session runs inside db.batch(), so a run of edits is
+    written to disk once on exit instead of once per action.
+    """
+    with db.batch():
+        while True:
+            print("\n" + "-" * 60)
+            print(f"PLANES OF INTEREST - Category: {db.category}")
+            print("-" * 60)
+            print("\n  1. List all planes")
+            print("  2. Get plane details")
+            print("  3. Add plane")
+            print("  4. Update plane")
+            print("  5. Remove plane")
+            print("  6. List categories")
+            print("  7. Switch category")
+            print("  0. Back to main menu")
+
+            choice = _prompt("\nSelect option: ").strip()
+
+            action = _POI_MENU_ACTIONS.get(choice)
+            if action is not None:
+                action(db)
+            elif choice == "0":
+                break
+            else:
+                print("\nInvalid choice")
 
 
 def groups_menu(db: TypeGroupsDatabase):
     """Groups management menu."""
-    while True:
-        print("\n" + "-" * 60)
-        print("AIRCRAFT GROUPS")
-        print("-" * 60)
-        print("\n  1. List all groups")
-        print("  2. View group details")
-        print("  3. Create group")
-        print("  4. Add aircraft to group")
-        print("  5. Remove aircraft from group")
-        print("  6. Delete group")
-        print("  0. Back to main menu")
-
-        choice = input("\nSelect option: ").strip()
-
-        if choice == "1":
-            groups_list(db)
-        elif choice == "2":
-            groups_view_interactive(db)
-        elif choice == "3":
-            groups_create_interactive(db)
-        elif choice == "4":
-            groups_add_aircraft_interactive(db)
-        elif choice == "5":
-            groups_remove_aircraft_interactive(db)
-        elif choice == "6":
-            groups_delete_interactive(db)
-        elif choice == "0":
-            break
-        else:
-            print("\nInvalid choice")
+    with db.batch():
+        while True:
+            print("\n" + "-" * 60)
+            print("AIRCRAFT GROUPS")
+            print("-" * 60)
+            print("\n  1. List all groups")
+            print("  2. View group details")
+            print("  3. Create group")
+            print("  4. Add aircraft to group")
+            print("  5. Remove aircraft from group")
+            print("  6. Delete group")
+            print("  0. Back to main menu")
+
+            choice = _prompt("\nSelect option: ").strip()
+
+            action = _GROUPS_MENU_ACTIONS.get(choice)
+            if action is not None:
+                action(db)
+            elif choice == "0":
+                break
+            else:
+                print("\nInvalid choice")
 
 
 def glossary_menu(db: TypeGroupsDatabase):
     """Glossary management menu."""
-    while True:
-        print("\n" + "-" * 60)
-        print("AIRCRAFT GLOSSARY")
-        print("-" * 60)
-        print("\n  1. List all aircraft types")
-        print("  2. Get aircraft type details")
-        print("  3. Search aircraft types")
-        print("  4. Add aircraft type")
-        print("  5. Update aircraft type")
-        print("  6. Remove aircraft type")
-        print("  0. Back to main menu")
-
-        choice = input("\nSelect option: ").strip()
-
-        if choice == "1":
-            glossary_list(db)
-        elif choice == "2":
-            glossary_get_interactive(db)
-        elif choice == "3":
-            glossary_search_interactive(db)
-        elif choice == "4":
-            glossary_add_interactive(db)
-        elif choice == "5":
-            glossary_update_interactive(db)
-        elif choice == "6":
-            glossary_remove_interactive(db)
-        elif choice == "0":
-            break
-        else:
-            print("\nInvalid choice")
+    with db.batch():
+        while True:
+            print("\n" + "-" * 60)
+            print("AIRCRAFT GLOSSARY")
+            print("-" * 60)
+            print("\n  1. List all aircraft types")
+            print("  2. Get aircraft type details")
+            print("  3. Search aircraft types")
+            print("  4. Add aircraft type")
+            print("  5. Update aircraft type")
+            print("  6. Remove aircraft type")
+            print("  0. Back to main menu")
+
+            choice = _prompt("\nSelect option: ").strip()
+
+            action = _GLOSSARY_MENU_ACTIONS.get(choice)
+            if action is not None:
+                action(db)
+            elif choice == "0":
+                break
+            else:
+                print("\nInvalid choice")
 
 
 # =============================================================================
 # CLI Mode (backward compatibility)
 # =============================================================================
 
-def cli_mode():
-    """Run in CLI mode with arguments."""
+# Parser built lazily on first use and reused on repeat cli_mode() calls
+# (test harnesses and embedders); a single CLI invocation sees no change.
+_PARSER = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Manage Glycol databases (POI and aircraft groups)",
         epilog="Run without arguments to enter interactive mode"
@@ -671,6 +840,11 @@ def cli_mode():
     poi_get = poi_sub.add_parser("get", help="Get plane details")
     poi_get.add_argument("identifier", help="Tail number or ICAO24")
 
+    poi_sub.add_parser(
+        "batch",
+        help="Apply JSON Lines operations (add/update/remove) from stdin",
+    )
+
     # Groups commands
     groups_parser = subparsers.add_parser("groups", help="Aircraft groups commands")
     groups_sub = groups_parser.add_subparsers(dest="groups_command")
@@ -692,7 +866,16 @@ def cli_mode():
     glossary_search = glossary_sub.add_parser("search", help="Search aircraft types")
     glossary_search.add_argument("query", help="Search query")
 
-    args = parser.parse_args()
+    return parser
+
+
+def cli_mode():
+    """Run in CLI mode with arguments."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args()
+    _load_databases()
 
     # Interactive mode if no command or -i flag
     if args.interactive or not args.command:
@@ -720,16 +903,22 @@ def cli_mode():
                 print(f"Plane already exists: {args.tail}")
                 sys.exit(1)
         elif args.poi_command == "get":
-            plane = db.get_by_icao24(args.identifier) or db.get_by_tailnumber(args.identifier)
+            plane = _find_plane(db, args.identifier)
             if plane:
-                print(f"\nCode:        {plane.tailnumber}")
-                print(f"Name:        {plane.name}")
-                print(f"ICAO24:      {plane.icao24}")
-                print(f"Make/Model:  {plane.make_model}")
-                print(f"Notes:       {plane.notes}")
+                # Scripted callers invoke this in tight loops; one write
+                # instead of five
+                sys.stdout.write(
+                    f"\nCode:        {plane.tailnumber}\n"
+                    f"Name:        {plane.name}\n"
+                    f"ICAO24:      {plane.icao24}\n"
+                    f"Make/Model:  {plane.make_model}\n"
+                    f"Notes:       {plane.notes}\n"
+                )
             else:
                 print(f"Plane not found: {args.identifier}")
                 sys.exit(1)
+        elif args.poi_command == "batch":
+            poi_batch(db)
 
     elif args.command == "groups":
         db = TypeGroupsDatabase(data_dir=args.data_dir)
@@ -739,8 +928,9 @@ def cli_mode():
             codes = db.get_group(args.name)
             if codes:
                 print(f"\n{args.name}:")
-                for code in sorted(codes):
-                    aircraft = db.get_aircraft_type(code)
+                types_map = db.get_aircraft_types_bulk(codes)
+                for code in codes:
+                    aircraft = types_map[code]
                     if aircraft:
                         print(f"  {code:<8} - {aircraft.make} {aircraft.model}")
                     else:
@@ -756,17 +946,19 @@ def cli_mode():
         elif args.glossary_command == "get":
             aircraft = db.get_aircraft_type(args.code)
             if aircraft:
-                print(f"\nCode:  {aircraft.code}")
-                print(f"Make:  {aircraft.make}")
-                print(f"Model: {aircraft.model}")
-                print(f"Notes: {aircraft.notes}")
+                sys.stdout.write(
+                    f"\nCode:  {aircraft.code}\n"
+                    f"Make:  {aircraft.make}\n"
+                    f"Model: {aircraft.model}\n"
+                    f"Notes: {aircraft.notes}\n"
+                )
             else:
                 print(f"Aircraft type not found: {args.code}")
                 sys.exit(1)
         elif args.glossary_command == "search":
             results = db.search_types(args.query)
             if results:
-                for aircraft in sorted(results, key=lambda a: a.code):
+                for aircraft in sorted(results, key=_AIRCRAFT_CODE_KEY):
                     print(f"{aircraft.code:<8} - {aircraft.make} {aircraft.model}")
             else:
                 print(f"No results found for: {args.query}")
@@ -7,47 +7,144 @@ import json
 import urllib.request
 from pathlib import Path
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional here
+    pd = None
+
+try:
+    import orjson
+
+    def _dump_airports(airports: dict, path: Path) -> None:
+        path.write_bytes(orjson.dumps(airports))
+
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _dump_airports(airports: dict, path: Path) -> None:
+        # Entry-at-a-time writes through the buffered file object:
+        # json.dump's C encoder materializes the whole document before
+        # the first byte reaches the file, holding the dict and its
+        # full encoding in memory at once
+        dumps = json.dumps
+        with open(path, "w") as f:
+            write = f.write
+            write("{")
+            first = True
+            for code, row in airports.items():
+                if first:
+                    first = False
+                else:
+                    write(",")
+                write(dumps(code))
+                write(":")
+                write(dumps(row, separators=(",", ":")))
+            write("}")
+
 OURAIRPORTS_CSV_URL = (
     "https://davidmegginson.github.io/ourairports-data/airports.csv"
 )
 
 OUTPUT_PATH = Path(__file__).resolve().parent.parent / "glycol" / "data" / "us_airports.json"
 
+# Include US states and territories (separate ISO codes in OurAirports).
+# Module-level so the row loop does a single hash probe instead of
+# rebuilding the set literal on every one of ~80k rows.
+US_CODES = frozenset({"US", "GU", "PR", "VI", "AS", "MP"})
 
-def fetch_airports() -> dict[str, list]:
-    """Download the OurAirports CSV and return US airports as a dict.
 
-    Returns dict of ``{ICAO: [lat, lon, name], ...}``.
+def _parse_airports_python(stream) -> dict[str, list]:
+    """Row-at-a-time fallback parse using the stdlib csv module.
+
+    csv.reader with positional indexing skips DictReader's dict-per-row
+    allocation, and the country gate runs first so the ~90% of rows that
+    are not US are rejected on one membership test without touching the
+    coordinate strings.
     """
-    print(f"Downloading {OURAIRPORTS_CSV_URL} ...")
-    with urllib.request.urlopen(OURAIRPORTS_CSV_URL) as resp:
-        text = resp.read().decode("utf-8")
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return {}
+    idx = {h: i for i, h in enumerate(header)}
+    i_ident = idx["ident"]
+    i_country = idx["iso_country"]
+    i_lat = idx["latitude_deg"]
+    i_lon = idx["longitude_deg"]
+    i_name = idx["name"]
 
-    reader = csv.DictReader(io.StringIO(text))
     airports: dict[str, list] = {}
+    us_codes = US_CODES  # local binding for the hot membership test
     for row in reader:
-        icao = row.get("ident", "").strip()
-        country = row.get("iso_country", "").strip()
-        # Include US states and territories (separate ISO codes in OurAirports)
-        US_CODES = {"US", "GU", "PR", "VI", "AS", "MP"}
-        if country not in US_CODES or not icao:
-            continue
         try:
-            lat = round(float(row["latitude_deg"]), 6)
-            lon = round(float(row["longitude_deg"]), 6)
-        except (ValueError, KeyError):
+            # No strip: OurAirports doesn't pad the country column, and
+            # the pandas path compares it unstripped too
+            if row[i_country] not in us_codes:
+                continue
+            icao = row[i_ident].strip()
+            if not icao:
+                continue
+            lat = round(float(row[i_lat]), 6)
+            lon = round(float(row[i_lon]), 6)
+            name = row[i_name].strip()
+        except (ValueError, IndexError):
+            # Malformed coordinates or a short row
             continue
-        name = row.get("name", icao).strip()
         airports[icao] = [lat, lon, name]
 
     return airports
 
 
+def _parse_airports_pandas(stream) -> dict[str, list]:
+    """Vectorized parse: pandas' C CSV reader plus boolean-mask filtering.
+
+    The ~80k-row CSV never touches a per-row Python loop — country
+    filtering, float coercion, and rounding all run column-at-a-time.
+    Rows with unparsable coordinates are dropped, matching the fallback.
+    """
+    df = pd.read_csv(
+        stream,
+        usecols=["ident", "iso_country", "latitude_deg", "longitude_deg", "name"],
+        dtype={"ident": str, "iso_country": str, "name": str},
+    )
+    df = df[df["iso_country"].isin(US_CODES)]
+
+    ident = df["ident"].fillna("").str.strip()
+    lat = pd.to_numeric(df["latitude_deg"], errors="coerce").round(6)
+    lon = pd.to_numeric(df["longitude_deg"], errors="coerce").round(6)
+    name = df["name"].fillna("").str.strip()
+
+    keep = (ident != "") & lat.notna() & lon.notna()
+    # .tolist() converts numpy scalars to plain Python floats/strs so the
+    # result serializes like the fallback's output
+    return {
+        i: [la, lo, n]
+        for i, la, lo, n in zip(
+            ident[keep].tolist(),
+            lat[keep].tolist(),
+            lon[keep].tolist(),
+            name[keep].tolist(),
+        )
+    }
+
+
+def fetch_airports() -> dict[str, list]:
+    """Download the OurAirports CSV and return US airports as a dict.
+
+    Returns dict of ``{ICAO: [lat, lon, name], ...}``.
+    """
+    print(f"Downloading {OURAIRPORTS_CSV_URL} ...")
+    with urllib.request.urlopen(OURAIRPORTS_CSV_URL) as resp:
+        # Decode incrementally straight off the socket instead of
+        # materializing the whole body as bytes and again as str
+        stream = io.TextIOWrapper(resp, encoding="utf-8", newline="")
+        if pd is not None:
+            return _parse_airports_pandas(stream)
+        return _parse_airports_python(stream)
+
+
 def main() -> None:
     airports = fetch_airports()
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(airports, f, separators=(",", ":"))
+    _dump_airports(airports, OUTPUT_PATH)
     print(f"Wrote {len(airports)} US airports to {OUTPUT_PATH}")
 
 
@@ -9,21 +9,24 @@ import logging
 import os
 from pathlib import Path
 
-from glycol.main import setup_logging
-from glycol.web import run_web_app
+# Environment-derived defaults, resolved once at import instead of per
+# main() call. The remaining options default to None and get their
+# env/fallback values downstream in run_web_app.
+_HOST_DEFAULT = os.getenv("HOST", "127.0.0.1")
+_PORT_DEFAULT = int(os.getenv("PORT", "8666"))
 
 
 def main():
     parser = argparse.ArgumentParser(description="Glycol Web Server")
     parser.add_argument(
         "--host",
-        default=os.getenv("HOST", "127.0.0.1"),
+        default=_HOST_DEFAULT,
         help="Host to bind to (default: from HOST env or 127.0.0.1)",
     )
     parser.add_argument(
         "--port",
         type=int,
-        default=int(os.getenv("PORT", "8666")),
+        default=_PORT_DEFAULT,
         help="Port to bind to (default: from PORT env or 8666)",
     )
     parser.add_argument(
@@ -67,6 +70,11 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred until after parsing: glycol.web drags in Flask and the
+    # monitoring stack, which --help and argument errors never need
+    from glycol.main import setup_logging
+    from glycol.web import run_web_app
+
     # Set up logging
     log_path = setup_logging(args.log_file, args.logs_dir)
     logging.info(f"Glycol Web Server starting - logging to {log_path}")